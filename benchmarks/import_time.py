@@ -0,0 +1,97 @@
+"""Measure how long `import indycar_data_parsing` takes in a fresh interpreter.
+
+Usage:
+    python benchmarks/import_time.py [--runs N] [--top N]
+
+Reports the median wall-clock import time over several fresh interpreters and
+the slowest modules from ``python -X importtime`` so regressions (for example
+an eager pandas or pdfplumber import) are easy to spot.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+HEAVY_MODULES = ("pandas", "pdfplumber", "polars", "pyarrow", "duckdb")
+
+_TIMING_SNIPPET = (
+    "import sys, time\n"
+    "t0 = time.perf_counter()\n"
+    "import indycar_data_parsing\n"
+    "elapsed = time.perf_counter() - t0\n"
+    "heavy = [m for m in {heavy!r} if m in sys.modules]\n"
+    "print(elapsed)\n"
+    "print(','.join(heavy))\n"
+)
+
+
+def _env() -> dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(SRC_DIR), env.get("PYTHONPATH")])
+    )
+    return env
+
+
+def measure_import_time() -> tuple[float, list[str]]:
+    """Import the package in a fresh interpreter.
+
+    Returns:
+        tuple[float, list[str]]: Seconds spent importing the package and the
+            heavy dependencies that ended up in ``sys.modules``.
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", _TIMING_SNIPPET.format(heavy=HEAVY_MODULES)],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=_env(),
+    )
+    elapsed, heavy = result.stdout.splitlines()
+    return float(elapsed), [m for m in heavy.split(",") if m]
+
+
+def slowest_imports(top: int) -> list[tuple[int, str]]:
+    """Return the ``top`` slowest cumulative imports (microseconds, module)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import indycar_data_parsing"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=_env(),
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        rows.append((int(cumulative), module.rstrip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    timings = []
+    heavy: list[str] = []
+    for _ in range(args.runs):
+        elapsed, heavy = measure_import_time()
+        timings.append(elapsed)
+
+    print(f"import indycar_data_parsing: median {statistics.median(timings) * 1000:.1f} ms "
+          f"over {args.runs} runs (min {min(timings) * 1000:.1f} ms)")
+    print(f"heavy modules loaded: {', '.join(heavy) or 'none'}")
+    print("slowest imports (cumulative):")
+    for cumulative, module in slowest_imports(args.top):
+        print(f"  {cumulative / 1000:8.1f} ms  {module}")
+
+
+if __name__ == "__main__":
+    main()
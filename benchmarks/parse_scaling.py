@@ -0,0 +1,78 @@
+"""Parse-performance regression harness.
+
+Usage:
+    python benchmarks/parse_scaling.py [--repeats N] [--no-time] [--update-baseline]
+
+Generates synthetic section results PDFs of increasing size (see
+``indycar_data_parsing.perf_harness``), records time and peak memory per stage,
+and fails if:
+
+- any parse entry point extracts a page more than once,
+- any stage's time grows worse than linearly in pages or cars,
+- validation takes more than a few percent of parse time,
+- any stage is slower or uses more memory than ``parse_baseline.json`` allows.
+
+Run with ``--update-baseline`` after an intentional performance change and
+commit the updated baseline.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from indycar_data_parsing import perf_harness  # noqa: E402
+
+BASELINE_PATH = Path(__file__).resolve().parent / "parse_baseline.json"
+DEFAULT_TOLERANCES = {"time": 3.0, "memory": 1.5}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=perf_harness.DEFAULT_REPEATS)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument(
+        "--no-time",
+        action="store_true",
+        help="Only compare memory and row counts to the baseline (for noisy machines).",
+    )
+    parser.add_argument(
+        "--max-exponent", type=float, default=perf_harness.DEFAULT_MAX_EXPONENT
+    )
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    failures = []
+    all_results = []
+    for axis, sizes in perf_harness.DEFAULT_SUITES.items():
+        results = perf_harness.run(sizes, repeats=args.repeats)
+        print(f"== scaling in {axis} ==")
+        print(perf_harness.format_results(results))
+        failures += perf_harness.check_page_reads(results)
+        failures += perf_harness.check_scaling(results, axis, args.max_exponent)
+        failures += perf_harness.check_validation_overhead(results)
+        all_results += results
+
+    if args.update_baseline:
+        tolerances = DEFAULT_TOLERANCES
+        if args.baseline.exists():
+            tolerances = json.loads(args.baseline.read_text()).get("tolerances", tolerances)
+        unique = {perf_harness.size_key(result): result for result in all_results}
+        baseline = {"tolerances": tolerances, "runs": list(unique.values())}
+        args.baseline.write_text(json.dumps(baseline, indent=2) + "\n")
+        print(f"wrote {args.baseline}")
+    else:
+        baseline = json.loads(args.baseline.read_text())
+        failures += perf_harness.compare_to_baseline(
+            all_results, baseline, check_time=not args.no_time
+        )
+
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,5 @@
+import sys
+
+from indycar_data_parsing.cli import main
+
+sys.exit(main())
@@ -0,0 +1,181 @@
+"""Vectorized cross-car analytics over parsed section times.
+
+Every function takes the typed frame from ``columnar.to_polars`` holding any
+number of cars (and, with a ``Source`` column, any number of sessions) and
+computes its result with a single Polars group-by or window pass, rather than
+one pandas pass per car.
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+import polars as pl
+
+from indycar_data_parsing.columnar import (
+    LAP_COLUMN,
+    key_columns,
+    lap_time_expr,
+    section_time_columns,
+    session_columns,
+    sum_of_sections,
+)
+
+LAP_TIME = "lap_time"
+DEFAULT_ROLLING_WINDOW = 5
+
+
+def _with_lap_time(frame: pl.DataFrame, lap_time_column: str | None) -> pl.DataFrame:
+    return frame.with_columns(lap_time_expr(frame, lap_time_column).alias(LAP_TIME))
+
+
+def section_bests(frame: pl.DataFrame, lap_time_column: str | None = None) -> pl.DataFrame:
+    """Returns each car's best time in every section.
+
+    ``lap_time_column``, if given, is a lap total and is not treated as a section.
+
+    Returns:
+        pl.DataFrame: One row per car with the minimum of each section time column.
+    """
+    keys = key_columns(frame)
+    return (
+        frame.group_by(keys, maintain_order=True)
+        .agg(pl.col(section_time_columns(frame, exclude=lap_time_column)).min())
+        .sort(keys)
+    )
+
+
+def session_section_bests(
+    frame: pl.DataFrame, lap_time_column: str | None = None
+) -> pl.DataFrame:
+    """Returns the best time in every section across all cars of each session."""
+    sessions = session_columns(frame)
+    sections = pl.col(section_time_columns(frame, exclude=lap_time_column)).min()
+    if not sessions:
+        return frame.select(sections)
+    return frame.group_by(sessions, maintain_order=True).agg(sections).sort(sessions)
+
+
+def theoretical_best_laps(
+    frame: pl.DataFrame, lap_time_column: str | None = None
+) -> pl.DataFrame:
+    """Returns each car's theoretical best lap next to its best actual lap.
+
+    The theoretical best is the sum of the car's best section times.
+
+    Returns:
+        pl.DataFrame: One row per car with ``theoretical_best``, ``best_lap`` and
+            ``best_lap_delta`` (best lap minus theoretical best), in seconds.
+    """
+    keys = key_columns(frame)
+    sections = section_time_columns(frame, exclude=lap_time_column)
+    return (
+        _with_lap_time(frame, lap_time_column)
+        .group_by(keys, maintain_order=True)
+        .agg(
+            pl.col(sections).min(),
+            pl.col(LAP_TIME).min().alias("best_lap"),
+        )
+        .select(
+            *keys,
+            sum_of_sections(sections).alias("theoretical_best"),
+            "best_lap",
+        )
+        .with_columns(
+            (pl.col("best_lap") - pl.col("theoretical_best")).alias("best_lap_delta")
+        )
+        .sort(keys)
+    )
+
+
+def gaps_to_session_best(
+    frame: pl.DataFrame, lap_time_column: str | None = None
+) -> pl.DataFrame:
+    """Returns every lap with its gap to the session best lap and to the car's best lap.
+
+    Returns:
+        pl.DataFrame: One row per lap with ``lap_time``, ``gap_to_session_best`` and
+            ``gap_to_car_best``, in seconds.
+    """
+    keys = key_columns(frame)
+    sessions = session_columns(frame)
+    lap_time = pl.col(LAP_TIME)
+    session_best = lap_time.min().over(sessions) if sessions else lap_time.min()
+    return (
+        _with_lap_time(frame, lap_time_column)
+        .select(
+            *keys,
+            LAP_COLUMN,
+            LAP_TIME,
+            (lap_time - session_best).alias("gap_to_session_best"),
+            (lap_time - lap_time.min().over(keys)).alias("gap_to_car_best"),
+        )
+        .sort([*keys, LAP_COLUMN])
+    )
+
+
+def rolling_pace(
+    frame: pl.DataFrame,
+    window: int = DEFAULT_ROLLING_WINDOW,
+    lap_time_column: str | None = None,
+) -> pl.DataFrame:
+    """Returns each car's rolling mean lap time over the last ``window`` laps.
+
+    Returns:
+        pl.DataFrame: One row per lap with ``lap_time`` and ``rolling_pace`` (null
+            until the car has completed ``window`` laps).
+    """
+    keys = key_columns(frame)
+    return (
+        _with_lap_time(frame, lap_time_column)
+        .select(*keys, LAP_COLUMN, LAP_TIME)
+        .sort([*keys, LAP_COLUMN])
+        .with_columns(
+            pl.col(LAP_TIME).rolling_mean(window_size=window).over(keys).alias("rolling_pace")
+        )
+    )
+
+
+AGGREGATE_NAMES = (
+    "section_bests",
+    "session_section_bests",
+    "theoretical_best_laps",
+    "gaps_to_session_best",
+    "rolling_pace",
+)
+
+
+def aggregate_params_key(
+    lap_time_column: str | None = None, window: int = DEFAULT_ROLLING_WINDOW
+) -> str:
+    """Returns a file-name-safe key for the parameters ``build_aggregates`` was called with."""
+    column = (
+        hashlib.sha256(lap_time_column.encode()).hexdigest()[:16]
+        if lap_time_column is not None
+        else "sum"
+    )
+    return f"lap-{column}-window-{window}"
+
+
+def build_aggregates(
+    frame: pl.DataFrame,
+    lap_time_column: str | None = None,
+    window: int = DEFAULT_ROLLING_WINDOW,
+) -> dict[str, pl.DataFrame]:
+    """Computes every aggregate table in ``AGGREGATE_NAMES`` for the typed frame.
+
+    Args:
+        frame (pl.DataFrame): Typed section times from ``columnar.to_polars``.
+        lap_time_column (str | None): Column holding the lap total, if the document has one.
+        window (int): Number of laps in the rolling pace window.
+
+    Returns:
+        dict[str, pl.DataFrame]: The aggregate tables keyed by name.
+    """
+    return {
+        "section_bests": section_bests(frame, lap_time_column),
+        "session_section_bests": session_section_bests(frame, lap_time_column),
+        "theoretical_best_laps": theoretical_best_laps(frame, lap_time_column),
+        "gaps_to_session_best": gaps_to_session_best(frame, lap_time_column),
+        "rolling_pace": rolling_pace(frame, window, lap_time_column),
+    }
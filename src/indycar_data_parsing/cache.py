@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+
+# Bump when the parsed output changes shape so stale cache entries are ignored.
+CACHE_VERSION = 2
+
+
+class ParsedSectionTimesCache:
+    """On-disk cache of parsed section times, keyed by the content of the source PDF.
+
+    Entries are stored as Arrow IPC files so reading one back is much cheaper than
+    extracting text from the PDF again. Aggregate tables computed from the parsed
+    data (see ``analytics.build_aggregates``) are stored next to the entry.
+    """
+
+    def __init__(self, cache_dir: str | Path):
+        self._cache_dir = Path(cache_dir)
+        self._digests: dict[tuple[str, int, int], str] = {}
+
+    @property
+    def cache_dir(self) -> Path:
+        """Returns the directory holding the cache entries."""
+        return self._cache_dir
+
+    @staticmethod
+    def pdf_digest(pdf_path: str | Path) -> str:
+        """Returns the SHA-256 hex digest of the PDF file contents."""
+        digest = hashlib.sha256()
+        with open(pdf_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _digest(self, pdf_path: str | Path) -> str:
+        """Returns the PDF digest, hashing the file only once while it is unchanged."""
+        stat = os.stat(pdf_path)
+        key = (str(pdf_path), stat.st_mtime_ns, stat.st_size)
+        if key not in self._digests:
+            self._digests[key] = self.pdf_digest(pdf_path)
+        return self._digests[key]
+
+    def entry_path(self, pdf_path: str | Path) -> Path:
+        """Returns the cache file path for the given PDF."""
+        return self._cache_dir / f"v{CACHE_VERSION}-{self._digest(pdf_path)}.arrow"
+
+    def aggregate_path(self, pdf_path: str | Path, name: str, params_key: str = "") -> Path:
+        """Returns the cache file path for the named aggregate table of the given PDF.
+
+        ``params_key`` identifies the parameters the table was computed with (see
+        ``analytics.aggregate_params_key``), so tables built with different
+        parameters are cached separately.
+        """
+        suffix = f".{params_key}" if params_key else ""
+        return (
+            self._cache_dir
+            / f"v{CACHE_VERSION}-{self._digest(pdf_path)}.{name}{suffix}.arrow"
+        )
+
+    def get(self, pdf_path: str | Path) -> pd.DataFrame | None:
+        """Returns the cached section times for the PDF, or None on a cache miss."""
+        entry = self.entry_path(pdf_path)
+        if not entry.exists():
+            return None
+        import pyarrow as pa
+
+        with pa.memory_map(str(entry), "r") as source:
+            return pa.ipc.open_file(source).read_all().to_pandas()
+
+    def put(self, pdf_path: str | Path, df: pd.DataFrame) -> Path:
+        """Stores the section times for the PDF and returns the cache file path."""
+        import pyarrow as pa
+
+        entry = self.entry_path(pdf_path)
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        tmp = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+        with pa.OSFile(str(tmp), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        tmp.replace(entry)
+        return entry
+
+    def get_aggregates(
+        self, pdf_path: str | Path, names: Iterable[str], params_key: str = ""
+    ) -> dict[str, pl.DataFrame] | None:
+        """Returns the cached aggregate tables for the PDF, or None if any is missing."""
+        paths = {name: self.aggregate_path(pdf_path, name, params_key) for name in names}
+        if not all(path.exists() for path in paths.values()):
+            return None
+        import polars as pl
+
+        return {name: pl.read_ipc(path) for name, path in paths.items()}
+
+    def put_aggregates(
+        self, pdf_path: str | Path, tables: dict[str, pl.DataFrame], params_key: str = ""
+    ) -> None:
+        """Stores the aggregate tables for the PDF, computed with ``params_key``."""
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        for name, table in tables.items():
+            path = self.aggregate_path(pdf_path, name, params_key)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            table.write_ipc(tmp)
+            tmp.replace(path)
@@ -0,0 +1,327 @@
+"""Command line entry point: ``indycar-parse``.
+
+Parses section times for many cars from many IndyCar section results PDFs and
+writes them to a single CSV, Parquet, Arrow IPC or DuckDB output.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from multiprocessing import get_context
+from typing import TYPE_CHECKING, Sequence
+
+from indycar_data_parsing.outputs import OUTPUT_FORMATS, infer_output_format
+from indycar_data_parsing.timing import StageTimer
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+
+    from indycar_data_parsing.validation import ValidationReport
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Builds the argument parser for ``indycar-parse``."""
+    parser = argparse.ArgumentParser(
+        prog="indycar-parse",
+        description="Extract section times from IndyCar section results PDFs.",
+    )
+    parser.add_argument("pdfs", nargs="+", metavar="PDF", help="Section results PDFs to parse.")
+    parser.add_argument(
+        "-o", "--output", required=True, help="Output file; format inferred from its suffix."
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=OUTPUT_FORMATS,
+        help="Output format (default: inferred from the output suffix).",
+    )
+    parser.add_argument(
+        "-c",
+        "--car",
+        dest="cars",
+        action="append",
+        metavar="CAR",
+        help="Car number to keep, as printed (06 and 6 are different cars); repeat for "
+        "several cars (default: all cars).",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1, help="Number of PDFs to parse in parallel."
+    )
+    parser.add_argument(
+        "--cache-dir", help="Directory for caching parsed PDFs between runs."
+    )
+    parser.add_argument(
+        "--aggregates",
+        action="store_true",
+        help="Also write the analytics aggregate tables (cached with --cache-dir).",
+    )
+    parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="Run the consistency checks on the output and write the flagged rows "
+        "as a 'validation' table.",
+    )
+    parser.add_argument(
+        "--lap-time-column",
+        help="Parsed column holding the lap total (e.g. Total_time), used by "
+        "--aggregates and --validate. Without it lap times are the sum of the section "
+        "times and --validate skips the section sum check.",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print per-stage timings to stderr (summed across workers).",
+    )
+    return parser
+
+
+def parse_pdf(
+    pdf_path: str,
+    cache_dir: str | None = None,
+    aggregates: bool = False,
+    lap_time_column: str | None = None,
+) -> tuple[pd.DataFrame, dict[str, pl.DataFrame], dict[str, float]]:
+    """Parses every car in one PDF, using the cache when given.
+
+    Runs in worker processes, so it only takes and returns picklable values.
+
+    Args:
+        pdf_path (str): The section results PDF.
+        cache_dir (str | None): Directory for cached parse results, or None to skip caching.
+        aggregates (bool): Also compute (or load from the cache) the analytics aggregate tables.
+        lap_time_column (str | None): Column holding the lap total, if the document has one.
+
+    Returns:
+        tuple[pd.DataFrame, dict[str, pl.DataFrame], dict[str, float]]: The section times
+            for all cars, the aggregate tables (empty unless requested) and the seconds
+            spent in each stage.
+
+    Raises:
+        UnknownLapTimeColumnError: If ``lap_time_column`` is not a parsed column.
+    """
+    from indycar_data_parsing.cache import ParsedSectionTimesCache
+    from indycar_data_parsing.section_times_parser import AllCarsSectionTimesParser
+
+    timer = StageTimer()
+    cache = ParsedSectionTimesCache(cache_dir) if cache_dir else None
+    df = None
+    if cache is not None:
+        with timer.stage("cache read"):
+            df = cache.get(pdf_path)
+
+    if df is None:
+        parser = AllCarsSectionTimesParser(pdf_path)
+        with timer.stage("read pdf"):
+            pages = parser.read_pages()
+        with timer.stage("parse"):
+            df = parser.laps_to_dataframe(parser.parse_pages(pages))
+        if cache is not None:
+            with timer.stage("cache write"):
+                cache.put(pdf_path, df)
+
+    # PDFs without car sections (cover or summary pages) have no laps at all.
+    if df.empty:
+        return df, {}, timer.timings
+    check_lap_time_column(df, lap_time_column, pdf_path)
+
+    tables = {}
+    if aggregates:
+        from indycar_data_parsing.analytics import (
+            AGGREGATE_NAMES,
+            aggregate_params_key,
+            build_aggregates,
+        )
+
+        params_key = aggregate_params_key(lap_time_column)
+        if cache is not None:
+            with timer.stage("cache read"):
+                tables = cache.get_aggregates(pdf_path, AGGREGATE_NAMES, params_key) or {}
+        if not tables:
+            typed = _typed(df, timer)
+            with timer.stage("aggregates"):
+                tables = build_aggregates(typed, lap_time_column)
+            if cache is not None:
+                with timer.stage("cache write"):
+                    cache.put_aggregates(pdf_path, tables, params_key)
+    return df, tables, timer.timings
+
+
+class UnknownLapTimeColumnError(ValueError):
+    """Raised when ``--lap-time-column`` names a column the parser did not produce."""
+
+
+def check_lap_time_column(
+    df: pd.DataFrame, lap_time_column: str | None, pdf_path: str
+) -> None:
+    """Checks that ``lap_time_column`` is one of the parsed columns.
+
+    Raises:
+        UnknownLapTimeColumnError: If it is not.
+    """
+    if lap_time_column is None or lap_time_column in df.columns:
+        return
+    time_columns = [column for column in df.columns if column.endswith("_time")]
+    raise UnknownLapTimeColumnError(
+        f"--lap-time-column '{lap_time_column}' is not a column of {pdf_path}; "
+        f"time columns are: {', '.join(time_columns)}"
+    )
+
+
+def _typed(df: pd.DataFrame, timer: StageTimer) -> pl.DataFrame:
+    from indycar_data_parsing.columnar import to_polars
+
+    with timer.stage("to polars"):
+        return to_polars(df)
+
+
+def _import_worker_dependencies() -> None:
+    """Imports the parsing libraries up front in a spawned worker.
+
+    Otherwise the first ``parse_pdf`` call in each worker pays for them inside its
+    timed stages, and ``--profile`` charges import time to "read pdf" and "parse".
+    """
+    import pandas  # noqa: F401
+    import pdfplumber  # noqa: F401
+    import polars  # noqa: F401
+
+
+def parse_pdfs(
+    pdf_paths: Sequence[str],
+    cars: Sequence[str] | None = None,
+    jobs: int = 1,
+    cache_dir: str | None = None,
+    aggregates: bool = False,
+    lap_time_column: str | None = None,
+    timer: StageTimer | None = None,
+) -> tuple[pd.DataFrame, dict[str, pl.DataFrame]]:
+    """Parses many PDFs, optionally in parallel, into one DataFrame.
+
+    Every output has a ``Source`` column holding the PDF path each row came from.
+    Aggregates are computed per PDF over all cars, so gaps to the session best stay
+    relative to the whole field even when ``cars`` filters the output.
+
+    Returns:
+        tuple[pd.DataFrame, dict[str, pl.DataFrame]]: The section times and the
+            aggregate tables (empty unless ``aggregates`` is set).
+    """
+    import pandas as pd
+
+    timer = timer or StageTimer()
+    worker = partial(
+        parse_pdf,
+        cache_dir=cache_dir,
+        aggregates=aggregates,
+        lap_time_column=lap_time_column,
+    )
+    if jobs > 1 and len(pdf_paths) > 1:
+        # Polars and pdfplumber may have started threads; forking those is unsafe.
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(pdf_paths)),
+            mp_context=get_context("spawn"),
+            initializer=_import_worker_dependencies,
+        ) as pool:
+            results = list(pool.map(worker, pdf_paths))
+    else:
+        results = [worker(path) for path in pdf_paths]
+
+    with timer.stage("combine"):
+        frames = []
+        tables: dict[str, list[pl.DataFrame]] = {}
+        for pdf_path, (df, pdf_tables, timings) in zip(pdf_paths, results):
+            timer.merge(timings)
+            if cars and "Car" in df.columns:
+                df = df[df["Car"].isin(cars)]
+            # Empty frames (cover pages, filtered-out cars) have no columns to align
+            # with and would make pandas upcast the others in the concat.
+            if not df.empty:
+                frames.append(df.assign(Source=pdf_path))
+            for name, table in pdf_tables.items():
+                tables.setdefault(name, []).append(_with_source(table, pdf_path, cars))
+        combined = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        combined_tables = {name: _concat(parts) for name, parts in tables.items()}
+    return combined, combined_tables
+
+
+def _with_source(
+    table: pl.DataFrame, pdf_path: str, cars: Sequence[str] | None
+) -> pl.DataFrame:
+    import polars as pl
+
+    if cars and "Car" in table.columns:
+        table = table.filter(pl.col("Car").is_in(cars))
+    return table.select(pl.lit(pdf_path).alias("Source"), pl.all())
+
+
+def _concat(tables: list[pl.DataFrame]) -> pl.DataFrame:
+    import polars as pl
+
+    return pl.concat(tables, how="diagonal_relaxed")
+
+
+def validate_output(
+    df: pd.DataFrame, lap_time_column: str | None = None, timer: StageTimer | None = None
+) -> ValidationReport:
+    """Runs the consistency checks over the combined output.
+
+    Row numbers in the report refer to rows of the written section times.
+    """
+    from indycar_data_parsing.validation import validate
+
+    timer = timer or StageTimer()
+    typed = _typed(df, timer)
+    with timer.stage("validate"):
+        return validate(typed, lap_time_column)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Runs ``indycar-parse`` with the given arguments and returns the exit code."""
+    arg_parser = build_arg_parser()
+    args = arg_parser.parse_args(argv)
+    if args.jobs < 1:
+        arg_parser.error("--jobs must be at least 1")
+    try:
+        fmt = args.format or infer_output_format(args.output)
+    except ValueError as e:
+        arg_parser.error(str(e))
+
+    timer = StageTimer()
+    start = time.perf_counter()
+    try:
+        df, tables = parse_pdfs(
+            args.pdfs,
+            cars=args.cars,
+            jobs=args.jobs,
+            cache_dir=args.cache_dir,
+            aggregates=args.aggregates,
+            lap_time_column=args.lap_time_column,
+            timer=timer,
+        )
+    except UnknownLapTimeColumnError as e:
+        arg_parser.error(str(e))
+    if args.validate:
+        lap_time_column = args.lap_time_column if not df.empty else None
+        report = validate_output(df, lap_time_column, timer)
+        print(report.summary(), file=sys.stderr)
+        tables["validation"] = report.flagged
+    from indycar_data_parsing.outputs import table_output_path, write_output
+
+    with timer.stage("write"):
+        write_output(df, args.output, fmt)
+        for name, table in tables.items():
+            write_output(
+                table.to_pandas(), table_output_path(args.output, fmt, name), fmt, name
+            )
+
+    if args.profile:
+        print(timer.report(), file=sys.stderr)
+        print(f"total wall time: {(time.perf_counter() - start) * 1000:.1f} ms", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""Typed Polars view of parsed section times.
+
+The parsers return every value as a string. ``to_polars`` turns that output into a
+typed frame (car numbers as strings, integer lap numbers, times in seconds, speeds
+as floats) that the analytics and validation layers can work on with vectorized
+expressions.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import polars as pl
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+CAR_COLUMN = "Car"
+LAP_COLUMN = "Lap"
+SOURCE_COLUMN = "Source"
+TIME_SUFFIX = "_time"
+SPEED_SUFFIX = "_speed"
+# The T/S column holds the row marker ("T" or "S"), not a section time.
+MARKER_COLUMN = "T/S_time"
+
+
+def _seconds(column: str) -> pl.Expr:
+    """Parses ``"ss.sss"`` or ``"m:ss.sss"`` strings into seconds."""
+    text = pl.col(column).str.strip_chars()
+    parts = text.str.split(":")
+    minutes_and_seconds = parts.list.get(0, null_on_oob=True).cast(
+        pl.Float64, strict=False
+    ) * 60 + parts.list.get(1, null_on_oob=True).cast(pl.Float64, strict=False)
+    return (
+        pl.when(parts.list.len() == 2)
+        .then(minutes_and_seconds)
+        .otherwise(text.cast(pl.Float64, strict=False))
+        .alias(column)
+    )
+
+
+def _float(column: str, dtype: pl.DataType) -> pl.Expr:
+    if dtype == pl.String:
+        return pl.col(column).str.strip_chars().cast(pl.Float64, strict=False)
+    return pl.col(column).cast(pl.Float64, strict=False)
+
+
+def to_polars(df: pd.DataFrame | pl.DataFrame) -> pl.DataFrame:
+    """Converts parser output into a typed Polars frame.
+
+    Car numbers stay strings (``06`` and ``6`` are different cars), lap numbers become
+    integers, section times become seconds and speeds become floats. Values that
+    cannot be parsed become null rather than raising.
+
+    Args:
+        df (pd.DataFrame | pl.DataFrame): Output of ``parse_section_times`` (single or all cars).
+
+    Returns:
+        pl.DataFrame: The typed frame with the same column names.
+    """
+    frame = df if isinstance(df, pl.DataFrame) else pl.from_pandas(df)
+    exprs = []
+    for column, dtype in frame.schema.items():
+        if column == CAR_COLUMN:
+            exprs.append(pl.col(column).cast(pl.String).str.strip_chars())
+        elif column == LAP_COLUMN:
+            exprs.append(_float(column, dtype).cast(pl.Int64, strict=False).alias(column))
+        elif column.endswith(SPEED_SUFFIX):
+            exprs.append(_float(column, dtype).alias(column))
+        elif column.endswith(TIME_SUFFIX) and column != MARKER_COLUMN:
+            exprs.append(
+                _seconds(column) if dtype == pl.String else _float(column, dtype).alias(column)
+            )
+    return frame.with_columns(exprs) if exprs else frame
+
+
+def section_time_columns(frame: pl.DataFrame, exclude: str | None = None) -> list[str]:
+    """Returns the section time columns of a typed frame, in document order.
+
+    The parser suffixes every header column with ``_time``, so a lap total column
+    looks like a section; pass it as ``exclude`` to leave it out.
+    """
+    return [
+        column
+        for column in frame.columns
+        if column.endswith(TIME_SUFFIX) and column not in (MARKER_COLUMN, exclude)
+    ]
+
+
+def sum_of_sections(sections: list[str]) -> pl.Expr:
+    """Returns the sum of the section time columns (null if any is missing, or if there are none)."""
+    if not sections:
+        return pl.lit(None, dtype=pl.Float64)
+    return pl.sum_horizontal(sections, ignore_nulls=False)
+
+
+def key_columns(frame: pl.DataFrame) -> list[str]:
+    """Returns the columns identifying a car within a session (``Source`` and ``Car``)."""
+    return [column for column in (SOURCE_COLUMN, CAR_COLUMN) if column in frame.columns]
+
+
+def session_columns(frame: pl.DataFrame) -> list[str]:
+    """Returns the columns identifying a session (``Source`` when several PDFs are combined)."""
+    return [SOURCE_COLUMN] if SOURCE_COLUMN in frame.columns else []
+
+
+def lap_time_expr(frame: pl.DataFrame, lap_time_column: str | None = None) -> pl.Expr:
+    """Returns an expression for the lap time in seconds.
+
+    Uses ``lap_time_column`` when the document carries a lap total, otherwise the sum
+    of the section times (null if any section time is missing).
+    """
+    if lap_time_column is not None:
+        return pl.col(lap_time_column)
+    return sum_of_sections(section_time_columns(frame))
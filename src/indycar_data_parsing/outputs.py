@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+OUTPUT_FORMATS = ("csv", "parquet", "arrow", "duckdb")
+
+_SUFFIX_FORMATS = {
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".arrow": "arrow",
+    ".ipc": "arrow",
+    ".feather": "arrow",
+    ".duckdb": "duckdb",
+    ".db": "duckdb",
+}
+
+DEFAULT_TABLE_NAME = "section_times"
+
+
+def infer_output_format(path: str | Path) -> str:
+    """Infers the output format from the file suffix of ``path``.
+
+    Raises:
+        ValueError: If the suffix does not map to a known output format.
+    """
+    suffix = Path(path).suffix.lower()
+    try:
+        return _SUFFIX_FORMATS[suffix]
+    except KeyError:
+        raise ValueError(
+            f"Cannot infer output format from '{path}'; expected one of {OUTPUT_FORMATS}"
+        ) from None
+
+
+def write_csv(df: pd.DataFrame, path: str | Path) -> None:
+    """Writes the DataFrame to a CSV file."""
+    df.to_csv(path, index=False)
+
+
+def write_parquet(df: pd.DataFrame, path: str | Path) -> None:
+    """Writes the DataFrame to a Parquet file."""
+    import pyarrow.parquet as pq
+
+    pq.write_table(_to_arrow(df), path)
+
+
+def write_arrow(df: pd.DataFrame, path: str | Path) -> None:
+    """Writes the DataFrame to an Arrow IPC file."""
+    import pyarrow as pa
+
+    table = _to_arrow(df)
+    with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+
+
+def write_duckdb(
+    df: pd.DataFrame, path: str | Path, table_name: str = DEFAULT_TABLE_NAME
+) -> None:
+    """Writes the DataFrame to a table in a DuckDB database, replacing any existing table."""
+    import duckdb
+
+    arrow_table = _to_arrow(df)
+    with duckdb.connect(str(path)) as con:
+        con.register("_section_times_arrow", arrow_table)
+        con.execute(
+            f'CREATE OR REPLACE TABLE "{table_name}" AS SELECT * FROM _section_times_arrow'
+        )
+        con.unregister("_section_times_arrow")
+
+
+_WRITERS = {
+    "csv": write_csv,
+    "parquet": write_parquet,
+    "arrow": write_arrow,
+    "duckdb": write_duckdb,
+}
+
+
+def write_output(
+    df: pd.DataFrame,
+    path: str | Path,
+    fmt: str | None = None,
+    table_name: str = DEFAULT_TABLE_NAME,
+) -> None:
+    """Writes the DataFrame to ``path`` in the given format.
+
+    Args:
+        df (pd.DataFrame): The section times to write.
+        path (str | Path): The destination file.
+        fmt (str | None): One of ``OUTPUT_FORMATS``; inferred from the suffix of ``path`` if None.
+        table_name (str): Table to write to; only used by the DuckDB format.
+
+    Raises:
+        ValueError: If the format is unknown or cannot be inferred.
+    """
+    fmt = fmt or infer_output_format(path)
+    if fmt not in _WRITERS:
+        raise ValueError(f"Unknown output format '{fmt}'; expected one of {OUTPUT_FORMATS}")
+    if fmt == "duckdb":
+        write_duckdb(df, path, table_name)
+    else:
+        _WRITERS[fmt](df, path)
+
+
+def table_output_path(path: str | Path, fmt: str, table_name: str) -> Path:
+    """Returns where to write an extra table alongside the main output.
+
+    DuckDB outputs hold every table in one database; file formats get a sibling
+    file named ``<stem>.<table_name><suffix>``.
+    """
+    path = Path(path)
+    if fmt == "duckdb":
+        return path
+    return path.with_name(f"{path.stem}.{table_name}{path.suffix}")
+
+
+def _to_arrow(df: pd.DataFrame):
+    import pyarrow as pa
+
+    return pa.Table.from_pandas(df, preserve_index=False)
@@ -1,15 +1,20 @@
-import pdfplumber
 from typing import Generator
 
 
 class PDFReader:
-    """Simple PDF reader that returns the raw text of each page."""
+    """Simple PDF reader that returns the raw text of each page.
+
+    pdfplumber is imported on first read rather than at module import so that
+    importing the package stays cheap.
+    """
 
     def __init__(self, pdf_path: str):
         self.pdf_path = pdf_path
 
     def read_pages(self) -> Generator[str, None, None]:
         """Yields the raw text of each page in the PDF."""
+        import pdfplumber
+
         with pdfplumber.open(self.pdf_path) as pdf:
             for page in pdf.pages:
                 yield page.extract_text()
@@ -20,5 +25,7 @@ class PDFReader:
 
     def num_pages(self) -> int:
         """Returns the number of pages in the PDF."""
+        import pdfplumber
+
         with pdfplumber.open(self.pdf_path) as pdf:
             return len(pdf.pages)
@@ -0,0 +1,435 @@
+"""Deterministic parse-performance regression harness.
+
+Generates synthetic section results PDFs of increasing size, runs them through
+the ``PDFReader``, ``AllCarsSectionTimesParser`` and ``SectionTimesParser``
+entry points and the typed/validation/analytics stages, and records per stage:
+
+- wall-clock seconds (best of several repeats),
+- peak memory allocated (from a separate ``tracemalloc`` run),
+- how many pages were extracted from the PDF.
+
+Results are compared to a stored baseline with tolerances, and stage times are
+checked to grow no worse than linearly in pages and cars. Page extraction counts
+are exact, so a change that re-reads the whole document for every car fails
+deterministically, independent of machine speed.
+
+See ``benchmarks/parse_scaling.py`` for the command line front end.
+"""
+
+from __future__ import annotations
+
+import math
+import tempfile
+from pathlib import Path
+from typing import Iterable, Sequence
+
+from indycar_data_parsing.pdf_reader import PDFReader
+from indycar_data_parsing.section_times_parser import (
+    AllCarsSectionTimesParser,
+    SectionTimesParser,
+)
+from indycar_data_parsing.timing import StageTimer
+
+LAPS_PER_PAGE = 20
+DEFAULT_SECTIONS = 2
+# Synthetic documents end each time row with the lap total, so the section sum
+# check runs along with the others.
+LAP_TOTAL_HEADER = "Total"
+LAP_TIME_COLUMN = f"{LAP_TOTAL_HEADER}_time"
+DEFAULT_REPEATS = 3
+# (cars, laps) sizes growing the PDF along one axis at a time, 1 to 8 pages each.
+DEFAULT_SUITES = {
+    "cars": [(1, 10), (2, 10), (4, 10), (8, 10)],
+    "pages": [(1, 20), (1, 40), (1, 80), (1, 160)],
+}
+DEFAULT_MAX_EXPONENT = 1.4
+# Validation (typing plus checks) may add at most this fraction of parse time.
+DEFAULT_MAX_VALIDATION_OVERHEAD = 0.05
+# Below this much parse time, fixed per-call costs dominate the ratio.
+DEFAULT_MIN_OVERHEAD_BASE_SECONDS = 0.1
+# Stages faster than this at the largest size are too noisy to fit an exponent to.
+DEFAULT_MIN_SCALING_SECONDS = 0.005
+# Absolute slack added to baseline comparisons so tiny stages do not flap.
+TIME_FLOOR_SECONDS = 0.002
+MEMORY_FLOOR_BYTES = 64 * 1024
+
+STAGE_READ = "read pdf"
+STAGE_PARSE_ALL = "parse all cars"
+STAGE_PARSE_ONE = "parse one car"
+STAGE_TO_POLARS = "to polars"
+STAGE_VALIDATE = "validate"
+STAGE_AGGREGATES = "aggregates"
+
+
+def section_times_pages(
+    cars: int, laps: int, sections: int = DEFAULT_SECTIONS
+) -> list[list[str]]:
+    """Builds the text lines of a synthetic section results document.
+
+    Every car gets ``ceil(laps / LAPS_PER_PAGE)`` pages, each starting with the car
+    section header and the column header, followed by a time row and a speed row
+    per lap. Time rows end with the lap total (``LAP_TOTAL_HEADER``). Values are
+    derived from the car, lap and section numbers, so the same arguments always
+    produce the same document.
+    """
+    section_names = [f"S{i}" for i in range(1, sections + 1)]
+    header = "Lap T/S " + " ".join([*section_names, LAP_TOTAL_HEADER])
+    pages = []
+    for car in range(1, cars + 1):
+        for first_lap in range(1, laps + 1, LAPS_PER_PAGE):
+            lines = [f"Section Data for Car {car}", header]
+            for lap in range(first_lap, min(first_lap + LAPS_PER_PAGE, laps + 1)):
+                times = [
+                    f"{10 + section + ((car * 7 + lap * 3 + section) % 100) / 100:.4f}"
+                    for section in range(sections)
+                ]
+                # Speed rows carry one more value than there are sections, as in
+                # the section results documents the parser is written against.
+                speeds = [
+                    f"{180 + ((car * 5 + lap * 11 + section) % 400) / 10:.3f}"
+                    for section in range(sections + 1)
+                ]
+                total = f"{sum(float(time) for time in times):.4f}"
+                lines.append(f"{lap} T " + " ".join([*times, total]))
+                lines.append("S " + " ".join(speeds))
+            pages.append(lines)
+    return pages
+
+
+def _escape(line: str) -> str:
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def write_text_pdf(path: str | Path, pages: Sequence[Sequence[str]]) -> Path:
+    """Writes a minimal PDF with one line of Helvetica text per entry in ``pages``.
+
+    Only uses the standard Type 1 fonts, so no PDF library is needed to build fixtures.
+    """
+    objects: list[bytes] = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"",  # page tree, filled in once the page object numbers are known
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    page_ids = []
+    for lines in pages:
+        ops = ["BT", "/F1 8 Tf", "10 TL", "36 770 Td"]
+        ops.extend(f"({_escape(line)}) Tj T*" for line in lines)
+        ops.append("ET")
+        stream = "\n".join(ops).encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Contents %d 0 R /Resources << /Font << /F1 3 0 R >> >> >>" % content_id
+        )
+        page_ids.append(len(objects))
+    kids = b" ".join(b"%d 0 R" % page_id for page_id in page_ids)
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_ids))
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    path = Path(path)
+    path.write_bytes(bytes(out))
+    return path
+
+
+def write_section_times_pdf(
+    path: str | Path, cars: int, laps: int, sections: int = DEFAULT_SECTIONS
+) -> Path:
+    """Writes a synthetic section results PDF; see ``section_times_pages``."""
+    return write_text_pdf(path, section_times_pages(cars, laps, sections))
+
+
+class CountingPDFReader(PDFReader):
+    """``PDFReader`` that counts how many pages have been extracted, across all instances.
+
+    The count lives on the class so that it also covers readers a parser creates
+    internally; ``_counting_reader`` makes a fresh subclass for each measurement.
+    """
+
+    pages_read = 0
+
+    def read_pages(self):
+        """Yields the raw text of each page in the PDF, counting each one."""
+        for text in super().read_pages():
+            type(self).pages_read += 1
+            yield text
+
+
+def _counting_reader() -> type[CountingPDFReader]:
+    return type("CountingPDFReader", (CountingPDFReader,), {"pages_read": 0})
+
+
+def _run_stages(pdf_path: Path, timer: StageTimer) -> dict[str, int]:
+    """Runs every stage once under ``timer``.
+
+    Returns:
+        dict[str, int]: The pages read by each parse entry point, plus ``rows`` parsed.
+    """
+    from indycar_data_parsing.analytics import build_aggregates
+    from indycar_data_parsing.columnar import to_polars
+    from indycar_data_parsing.validation import validate
+
+    page_reads = {}
+
+    with timer.stage(STAGE_READ):
+        list(PDFReader(str(pdf_path)).read_pages())
+
+    reader_cls = _counting_reader()
+    all_cars = AllCarsSectionTimesParser(str(pdf_path), pdf_reader_cls=reader_cls)
+    with timer.stage(STAGE_PARSE_ALL):
+        df = all_cars.parse_section_times()
+    page_reads[STAGE_PARSE_ALL] = reader_cls.pages_read
+
+    reader_cls = _counting_reader()
+    one_car = SectionTimesParser(str(pdf_path), 1, pdf_reader_cls=reader_cls)
+    with timer.stage(STAGE_PARSE_ONE):
+        one_car.parse_section_times()
+    page_reads[STAGE_PARSE_ONE] = reader_cls.pages_read
+
+    with timer.stage(STAGE_TO_POLARS):
+        typed = to_polars(df)
+    with timer.stage(STAGE_VALIDATE):
+        validate(typed, LAP_TIME_COLUMN)
+    with timer.stage(STAGE_AGGREGATES):
+        build_aggregates(typed, LAP_TIME_COLUMN)
+
+    page_reads["rows"] = df.shape[0]
+    return page_reads
+
+
+def measure(
+    cars: int,
+    laps: int,
+    workdir: str | Path,
+    repeats: int = DEFAULT_REPEATS,
+    sections: int = DEFAULT_SECTIONS,
+) -> dict:
+    """Measures every stage on a synthetic PDF of the given size.
+
+    Returns:
+        dict: ``cars``, ``laps``, ``pages``, ``rows``, ``page_reads`` per stage and
+            ``stages`` mapping each stage to its best ``seconds`` and ``peak_bytes``.
+    """
+    pages = section_times_pages(cars, laps, sections)
+    pdf_path = write_text_pdf(
+        Path(workdir) / f"cars{cars}-laps{laps}-sections{sections}.pdf", pages
+    )
+
+    seconds: dict[str, float] = {}
+    counts: dict[str, int] = {}
+    for _ in range(repeats):
+        timer = StageTimer()
+        counts = _run_stages(pdf_path, timer)
+        for name, elapsed in timer.timings.items():
+            seconds[name] = min(seconds.get(name, math.inf), elapsed)
+
+    memory_timer = StageTimer(track_memory=True)
+    _run_stages(pdf_path, memory_timer)
+    peak_memory = memory_timer.peak_memory
+
+    rows = counts.pop("rows")
+    return {
+        "cars": cars,
+        "laps": laps,
+        "sections": sections,
+        "pages": len(pages),
+        "rows": rows,
+        "page_reads": counts,
+        "stages": {
+            name: {"seconds": seconds[name], "peak_bytes": peak_memory[name]}
+            for name in seconds
+        },
+    }
+
+
+def run(
+    sizes: Iterable[tuple[int, int]],
+    repeats: int = DEFAULT_REPEATS,
+    sections: int = DEFAULT_SECTIONS,
+    workdir: str | Path | None = None,
+) -> list[dict]:
+    """Measures every ``(cars, laps)`` size; see ``measure``.
+
+    A warm-up pass runs first so that lazy imports and first-call caches are not
+    charged to the smallest size.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        warm_up = write_section_times_pdf(Path(tmp) / "warm-up.pdf", 1, 1, sections)
+        _run_stages(warm_up, StageTimer())
+        return [
+            measure(cars, laps, workdir or tmp, repeats=repeats, sections=sections)
+            for cars, laps in sizes
+        ]
+
+
+def scaling_exponent(sizes: Sequence[float], values: Sequence[float]) -> float:
+    """Returns the least-squares slope of ``log(values)`` against ``log(sizes)``.
+
+    A slope of 1 means linear growth, 2 quadratic.
+    """
+    if len(sizes) < 2:
+        raise ValueError("Need at least two sizes to estimate a scaling exponent")
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(value, 1e-9)) for value in values]
+    x_mean = sum(xs) / len(xs)
+    y_mean = sum(ys) / len(ys)
+    spread = sum((x - x_mean) ** 2 for x in xs)
+    if spread == 0:
+        raise ValueError("Need at least two distinct sizes to estimate a scaling exponent")
+    return sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys)) / spread
+
+
+def check_page_reads(results: Iterable[dict]) -> list[str]:
+    """Checks that each parse stage extracts every page exactly once.
+
+    Returns:
+        list[str]: One message per stage that read more (or fewer) pages than the PDF has.
+    """
+    failures = []
+    for result in results:
+        for stage, reads in result["page_reads"].items():
+            if reads != result["pages"]:
+                failures.append(
+                    f"{stage} at {result['cars']} cars x {result['laps']} laps read "
+                    f"{reads} pages for a {result['pages']} page PDF"
+                )
+    return failures
+
+
+def check_scaling(
+    results: Sequence[dict],
+    axis: str = "pages",
+    max_exponent: float = DEFAULT_MAX_EXPONENT,
+    min_seconds: float = DEFAULT_MIN_SCALING_SECONDS,
+) -> list[str]:
+    """Checks that no stage's time grows faster than ``size ** max_exponent``.
+
+    Args:
+        results (Sequence[dict]): Output of ``run`` for sizes varying along ``axis``.
+        axis (str): ``"pages"``, ``"cars"`` or ``"laps"``.
+        max_exponent (float): Largest acceptable scaling exponent.
+        min_seconds (float): Stages faster than this at the largest size are skipped.
+
+    Returns:
+        list[str]: One message per stage that scales worse than allowed.
+    """
+    ordered = sorted(results, key=lambda result: result[axis])
+    sizes = [result[axis] for result in ordered]
+    failures = []
+    for stage in ordered[-1]["stages"]:
+        seconds = [result["stages"][stage]["seconds"] for result in ordered]
+        if seconds[-1] < min_seconds:
+            continue
+        exponent = scaling_exponent(sizes, seconds)
+        if exponent > max_exponent:
+            failures.append(
+                f"{stage} time grows as {axis}^{exponent:.2f} (allowed {max_exponent})"
+            )
+    return failures
+
+
+def check_validation_overhead(
+    results: Iterable[dict],
+    max_fraction: float = DEFAULT_MAX_VALIDATION_OVERHEAD,
+    min_base_seconds: float = DEFAULT_MIN_OVERHEAD_BASE_SECONDS,
+) -> list[str]:
+    """Checks that validation stays a small fraction of end-to-end parse time.
+
+    Compares ``to polars`` + ``validate`` with ``parse all cars``, which reads the
+    PDF through the parser's own read path. Sizes whose parse time is below
+    ``min_base_seconds`` are skipped.
+
+    Returns:
+        list[str]: One message per size where validation costs more than ``max_fraction``.
+    """
+    failures = []
+    for result in results:
+        stages = result["stages"]
+        base = stages[STAGE_PARSE_ALL]["seconds"]
+        if base < min_base_seconds:
+            continue
+        overhead = stages[STAGE_TO_POLARS]["seconds"] + stages[STAGE_VALIDATE]["seconds"]
+        if overhead > max_fraction * base:
+            failures.append(
+                f"validation at {result['cars']} cars x {result['laps']} laps took "
+                f"{overhead / base:.1%} of parse time (allowed {max_fraction:.0%})"
+            )
+    return failures
+
+
+def size_key(result: dict) -> tuple[int, int, int]:
+    """Returns the ``(cars, laps, sections)`` that identify a result's fixture."""
+    return result["cars"], result["laps"], result["sections"]
+
+
+def compare_to_baseline(
+    results: Iterable[dict], baseline: dict, check_time: bool = True
+) -> list[str]:
+    """Compares results to a stored baseline.
+
+    ``baseline`` holds ``tolerances`` (``time`` and ``memory`` ratios) and ``runs``
+    in the format returned by ``run``. Sizes (cars, laps and sections) missing from
+    the baseline are skipped.
+
+    Returns:
+        list[str]: One message per stage whose time or peak memory exceeds the
+            baseline by more than the tolerance, or whose row count changed.
+    """
+    tolerances = baseline.get("tolerances", {})
+    time_tolerance = tolerances.get("time", 2.0)
+    memory_tolerance = tolerances.get("memory", 1.5)
+    expected = {size_key(run): run for run in baseline["runs"]}
+    failures = []
+    for result in results:
+        size = size_key(result)
+        if size not in expected:
+            continue
+        base = expected[size]
+        label = f"{size[0]} cars x {size[1]} laps x {size[2]} sections"
+        if result["rows"] != base["rows"]:
+            failures.append(f"{label}: parsed {result['rows']} rows, baseline {base['rows']}")
+        for stage, measured in result["stages"].items():
+            if stage not in base["stages"]:
+                continue
+            reference = base["stages"][stage]
+            time_limit = reference["seconds"] * time_tolerance + TIME_FLOOR_SECONDS
+            if check_time and measured["seconds"] > time_limit:
+                failures.append(
+                    f"{label}: {stage} took {measured['seconds'] * 1000:.1f} ms, "
+                    f"limit {time_limit * 1000:.1f} ms"
+                )
+            memory_limit = reference["peak_bytes"] * memory_tolerance + MEMORY_FLOOR_BYTES
+            if measured["peak_bytes"] > memory_limit:
+                failures.append(
+                    f"{label}: {stage} peaked at {measured['peak_bytes'] / 1024:.0f} KiB, "
+                    f"limit {memory_limit / 1024:.0f} KiB"
+                )
+    return failures
+
+
+def format_results(results: Iterable[dict]) -> str:
+    """Returns a human readable table of ``run`` results."""
+    lines = []
+    for result in results:
+        lines.append(
+            f"{result['cars']} cars x {result['laps']} laps "
+            f"({result['pages']} pages, {result['rows']} rows)"
+        )
+        width = max(len(stage) for stage in result["stages"])
+        for stage, measured in result["stages"].items():
+            lines.append(
+                f"  {stage:<{width}}  {measured['seconds'] * 1000:10.1f} ms"
+                f"  {measured['peak_bytes'] / 1024:10.1f} KiB peak"
+            )
+    return "\n".join(lines)
@@ -1,7 +1,13 @@
+from __future__ import annotations
+
 import re
-import pandas as pd
+from typing import TYPE_CHECKING, Iterable, Iterator
+
 from indycar_data_parsing.pdf_reader import PDFReader
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class PDFSectionExtractor:
     """
@@ -205,6 +211,8 @@ class SectionTimesParser:
         Returns:
             pd.DataFrame: A DataFrame containing the lap and section times for the specified car number.
         """
+        import pandas as pd
+
         laps = []
         col_names = []
         for text in self._extract_car_section_texts():
@@ -220,3 +228,119 @@ class SectionTimesParser:
             df["Lap"] = df["Lap_time"]
             df = df.drop(columns=["Lap_time"], errors="ignore")
         return df
+
+
+class AllCarsSectionTimesParser:
+    """Parser for extracting section times for many cars in a single pass over the PDF.
+
+    Parsing every car with ``SectionTimesParser`` re-reads the whole document once
+    per car. This parser reads each page once, splits it into per-car sections and
+    hands each section to a ``SectionTimesParser`` for that car.
+
+    Car numbers are kept as the strings printed in the document, since ``06`` and
+    ``6`` are different cars.
+    """
+
+    CAR_SECTION_HEADER_PATTERN = re.compile(r"^Section Data for Car\s+(\d+)$")
+
+    def __init__(
+        self,
+        pdf_path: str,
+        car_numbers: Iterable[str | int] | None = None,
+        pdf_reader_cls=PDFReader,
+        car_parser_cls=SectionTimesParser,
+    ):
+        self._pdf_path = pdf_path
+        self._car_numbers = (
+            None if car_numbers is None else frozenset(str(car) for car in car_numbers)
+        )
+        self._pdf_reader_cls = pdf_reader_cls
+        self._car_parser_cls = car_parser_cls
+
+    @property
+    def pdf_path(self) -> str:
+        """Returns the path to the PDF file."""
+        return self._pdf_path
+
+    @property
+    def car_numbers(self) -> frozenset[str] | None:
+        """Returns the car numbers to parse, or None to parse every car."""
+        return self._car_numbers
+
+    def wants_car(self, car_number: str) -> bool:
+        """Checks if the given car number should be parsed."""
+        return self._car_numbers is None or car_number in self._car_numbers
+
+    def iter_car_sections(self, page_texts) -> Iterator[tuple[str, list[str]]]:
+        """Yields ``(car_number, lines)`` for every car section in the given page texts.
+
+        As with ``PDFSectionExtractor``, a section starts at a car section header and
+        ends at the next car section header or the end of the page.
+        """
+        for text in page_texts:
+            if not text:
+                continue
+            car_number = None
+            section_lines: list[str] = []
+            for line in text.splitlines():
+                match = self.CAR_SECTION_HEADER_PATTERN.match(line.strip())
+                if match:
+                    if car_number is not None:
+                        yield car_number, section_lines
+                    car_number = match.group(1)
+                    section_lines = [line]
+                elif car_number is not None:
+                    section_lines.append(line)
+            if car_number is not None:
+                yield car_number, section_lines
+
+    def parse_pages(self, page_texts) -> list[dict[str, str]]:
+        """Parses lap and section times for the wanted cars from the given page texts.
+
+        Args:
+            page_texts (Iterable[str]): The raw text of each page.
+
+        Returns:
+            list[dict[str, str]]: One dictionary per lap, with the car number under ``"Car"``.
+        """
+        car_parsers = {}
+        laps = []
+        for car_number, lines in self.iter_car_sections(page_texts):
+            if not self.wants_car(car_number):
+                continue
+            if car_number not in car_parsers:
+                car_parsers[car_number] = self._car_parser_cls(self.pdf_path, car_number)
+            # Skip the section header: the car parser only recognises its own header
+            # in the canonical "Car <n>" spelling and would stop on "Car 06" or "Car  7".
+            for lap_dict in car_parsers[car_number]._parse_lines_for_laps(lines[1:], []):
+                lap_dict["Car"] = car_number
+                laps.append(lap_dict)
+        return laps
+
+    def read_pages(self) -> list[str]:
+        """Returns the raw text of every page in the PDF."""
+        return list(self._pdf_reader_cls(self.pdf_path).read_pages())
+
+    @staticmethod
+    def laps_to_dataframe(laps: list[dict[str, str]]) -> pd.DataFrame:
+        """Builds the section times DataFrame from parsed lap dictionaries.
+
+        Columns match ``SectionTimesParser.parse_section_times`` with a leading ``Car`` column.
+        """
+        import pandas as pd
+
+        df = pd.DataFrame(laps)
+        if "Lap_time" in df.columns:
+            df["Lap"] = df["Lap_time"]
+            df = df.drop(columns=["Lap_time"], errors="ignore")
+        if "Car" in df.columns:
+            df = df[["Car", *(col for col in df.columns if col != "Car")]]
+        return df
+
+    def parse_section_times(self) -> pd.DataFrame:
+        """Extracts lap and section times for the wanted cars from an IndyCar section results PDF.
+
+        Returns:
+            pd.DataFrame: A DataFrame containing the lap and section times for every wanted car.
+        """
+        return self.laps_to_dataframe(self.parse_pages(self.read_pages()))
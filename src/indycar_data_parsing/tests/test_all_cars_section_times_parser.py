@@ -0,0 +1,130 @@
+from unittest.mock import patch, MagicMock
+
+import pandas as pd
+
+from indycar_data_parsing.section_times_parser import (
+    AllCarsSectionTimesParser,
+    SectionTimesParser,
+)
+
+TWO_CAR_PAGE = (
+    "Section Data for Car 5\n"
+    "Lap   T/S   S1   S2\n"
+    "1   T   12.345   23.456\n"
+    "S   100.1   200.2   300.3\n"
+    "2   T   13.111   24.222\n"
+    "S   101.1   201.2   301.3\n"
+    "Section Data for Car 6\n"
+    "Lap   T/S   S1   S2\n"
+    "1   T   11.111   22.222\n"
+    "S   111.1   222.2   333.3\n"
+)
+THIRD_CAR_PAGE = (
+    "Section Data for Car 10\n"
+    "Lap   T/S   S1   S2\n"
+    "1   T   14.000   25.000\n"
+    "S   99.1   199.2   299.3\n"
+)
+
+
+def _mock_pdf(mock_pdf_open, *page_texts):
+    mock_pdf = MagicMock()
+    pages = []
+    for text in page_texts:
+        page = MagicMock()
+        page.extract_text.return_value = text
+        pages.append(page)
+    mock_pdf.pages = pages
+    mock_pdf_open.return_value.__enter__.return_value = mock_pdf
+    return mock_pdf
+
+
+def test_iter_car_sections_splits_pages_by_car():
+    parser = AllCarsSectionTimesParser("dummy.pdf")
+    sections = list(parser.iter_car_sections([TWO_CAR_PAGE, "", THIRD_CAR_PAGE]))
+    assert [car for car, _ in sections] == ["5", "6", "10"]
+    assert sections[1][1][0] == "Section Data for Car 6"
+    assert "11.111" in sections[1][1][2]
+
+
+def test_iter_car_sections_ignores_lines_before_first_header():
+    parser = AllCarsSectionTimesParser("dummy.pdf")
+    sections = list(parser.iter_car_sections(["Page title\n1   T   1.0   2.0\n" + THIRD_CAR_PAGE]))
+    assert len(sections) == 1
+    assert sections[0][1][0] == "Section Data for Car 10"
+
+
+@patch("pdfplumber.open")
+def test_parse_section_times_all_cars(mock_pdf_open):
+    _mock_pdf(mock_pdf_open, TWO_CAR_PAGE, THIRD_CAR_PAGE)
+
+    df = AllCarsSectionTimesParser("dummy.pdf").parse_section_times()
+    assert isinstance(df, pd.DataFrame)
+    assert df.columns[0] == "Car"
+    assert list(df["Car"]) == ["5", "5", "6", "10"]
+    assert list(df["Lap"]) == ["1", "2", "1", "1"]
+    assert df.iloc[2]["S1_time"] == "11.111"
+    assert df.iloc[3]["S1_time_speed"] == "199.2"
+
+
+@patch("pdfplumber.open")
+def test_parse_section_times_filters_cars(mock_pdf_open):
+    _mock_pdf(mock_pdf_open, TWO_CAR_PAGE, THIRD_CAR_PAGE)
+
+    df = AllCarsSectionTimesParser("dummy.pdf", car_numbers=["6", 10]).parse_section_times()
+    assert list(df["Car"]) == ["6", "10"]
+
+
+@patch("pdfplumber.open")
+def test_parse_section_times_reads_pdf_once(mock_pdf_open):
+    mock_pdf = _mock_pdf(mock_pdf_open, TWO_CAR_PAGE, THIRD_CAR_PAGE)
+
+    AllCarsSectionTimesParser("dummy.pdf").parse_section_times()
+    assert mock_pdf_open.call_count == 1
+    for page in mock_pdf.pages:
+        assert page.extract_text.call_count == 1
+
+
+@patch("pdfplumber.open")
+def test_parse_section_times_matches_single_car_parser(mock_pdf_open):
+    _mock_pdf(mock_pdf_open, TWO_CAR_PAGE, THIRD_CAR_PAGE)
+
+    all_cars = AllCarsSectionTimesParser("dummy.pdf").parse_section_times()
+    single = SectionTimesParser("dummy.pdf", 5).parse_section_times()
+    car_5 = all_cars[all_cars["Car"] == "5"].drop(columns=["Car"]).reset_index(drop=True)
+    pd.testing.assert_frame_equal(car_5, single)
+
+
+def test_parse_pages_keeps_car_numbers_as_printed():
+    parser = AllCarsSectionTimesParser("dummy.pdf")
+    laps = parser.parse_pages(
+        [
+            "Section Data for Car 06\nLap T/S S1\n1 T 12.0\nS 1 2",
+            "Section Data for Car  7\nLap T/S S1\n1 T 13.0\nS 1 2\n"
+            "Section Data for Car 6\nLap T/S S1\n1 T 14.0\nS 1 2",
+        ]
+    )
+    assert [(lap["Car"], lap["S1_time"]) for lap in laps] == [
+        ("06", "12.0"),
+        ("7", "13.0"),
+        ("6", "14.0"),
+    ]
+
+
+def test_parse_pages_filters_on_car_numbers_as_printed():
+    parser = AllCarsSectionTimesParser("dummy.pdf", car_numbers=["06"])
+    laps = parser.parse_pages(
+        [
+            "Section Data for Car 06\nLap T/S S1\n1 T 12.0",
+            "Section Data for Car 6\nLap T/S S1\n1 T 9.0",
+        ]
+    )
+    assert [(lap["Car"], lap["S1_time"]) for lap in laps] == [("06", "12.0")]
+
+
+@patch("pdfplumber.open")
+def test_parse_section_times_empty_pdf(mock_pdf_open):
+    _mock_pdf(mock_pdf_open, "")
+
+    df = AllCarsSectionTimesParser("dummy.pdf").parse_section_times()
+    assert df.empty
@@ -0,0 +1,130 @@
+import polars as pl
+import pytest
+
+from indycar_data_parsing.analytics import (
+    AGGREGATE_NAMES,
+    build_aggregates,
+    gaps_to_session_best,
+    rolling_pace,
+    section_bests,
+    session_section_bests,
+    theoretical_best_laps,
+)
+
+
+@pytest.fixture
+def frame():
+    return pl.DataFrame(
+        {
+            "Car": [5, 5, 5, 6, 6],
+            "T/S_time": ["T"] * 5,
+            "S1_time": [10.0, 9.0, 11.0, 9.5, 10.5],
+            "S2_time": [20.0, 21.0, 19.0, 20.5, 19.5],
+            "Lap": [1, 2, 3, 1, 2],
+        }
+    )
+
+
+def test_section_bests(frame):
+    result = section_bests(frame)
+    assert result["Car"].to_list() == [5, 6]
+    assert result["S1_time"].to_list() == [9.0, 9.5]
+    assert result["S2_time"].to_list() == [19.0, 19.5]
+
+
+def test_session_section_bests(frame):
+    result = session_section_bests(frame)
+    assert result.row(0, named=True) == {"S1_time": 9.0, "S2_time": 19.0}
+
+
+def test_session_section_bests_per_source(frame):
+    two_sessions = pl.concat(
+        [
+            frame.with_columns(Source=pl.lit("a.pdf")),
+            frame.with_columns(Source=pl.lit("b.pdf"), S1_time=pl.col("S1_time") + 1),
+        ]
+    )
+    result = session_section_bests(two_sessions)
+    assert result["Source"].to_list() == ["a.pdf", "b.pdf"]
+    assert result["S1_time"].to_list() == [9.0, 10.0]
+
+
+def test_theoretical_best_laps(frame):
+    result = theoretical_best_laps(frame)
+    assert result["theoretical_best"].to_list() == [28.0, 29.0]
+    assert result["best_lap"].to_list() == [30.0, 30.0]
+    assert result["best_lap_delta"].to_list() == [2.0, 1.0]
+
+
+def test_gaps_to_session_best(frame):
+    result = gaps_to_session_best(frame)
+    assert result.columns == [
+        "Car",
+        "Lap",
+        "lap_time",
+        "gap_to_session_best",
+        "gap_to_car_best",
+    ]
+    assert result["lap_time"].to_list() == [30.0, 30.0, 30.0, 30.0, 30.0]
+    assert result["gap_to_session_best"].to_list() == [0.0] * 5
+
+
+def test_gaps_to_session_best_with_lap_time_column(frame):
+    result = gaps_to_session_best(frame, lap_time_column="S1_time")
+    assert result["gap_to_session_best"].to_list() == [1.0, 0.0, 2.0, 0.5, 1.5]
+    assert result["gap_to_car_best"].to_list() == [1.0, 0.0, 2.0, 0.0, 1.0]
+
+
+def test_rolling_pace(frame):
+    result = rolling_pace(frame, window=2, lap_time_column="S1_time")
+    assert result["rolling_pace"].to_list() == [None, 9.5, 10.0, None, 10.0]
+
+
+def test_rolling_pace_sorts_by_lap(frame):
+    shuffled = frame.reverse()
+    result = rolling_pace(shuffled, window=2, lap_time_column="S1_time")
+    assert result["Lap"].to_list() == [1, 2, 3, 1, 2]
+    assert result["rolling_pace"].to_list() == [None, 9.5, 10.0, None, 10.0]
+
+
+def test_build_aggregates(frame):
+    tables = build_aggregates(frame)
+    assert tuple(tables) == AGGREGATE_NAMES
+    assert all(isinstance(table, pl.DataFrame) for table in tables.values())
+
+
+@pytest.fixture
+def frame_with_total(frame):
+    return frame.with_columns(Total_time=pl.Series([30.0, 30.5, 30.0, 30.0, 30.5]))
+
+
+def test_section_bests_excludes_lap_time_column(frame_with_total):
+    result = section_bests(frame_with_total, lap_time_column="Total_time")
+    assert "Total_time" not in result.columns
+    assert session_section_bests(frame_with_total, "Total_time").columns == [
+        "S1_time",
+        "S2_time",
+    ]
+
+
+def test_theoretical_best_laps_excludes_lap_time_column(frame_with_total):
+    result = theoretical_best_laps(frame_with_total, lap_time_column="Total_time")
+    assert result["theoretical_best"].to_list() == [28.0, 29.0]
+    assert result["best_lap"].to_list() == [30.0, 30.0]
+    assert result["best_lap_delta"].to_list() == [2.0, 1.0]
+
+
+def test_lap_time_column_excluded_from_default_lap_time(frame_with_total):
+    result = gaps_to_session_best(frame_with_total, lap_time_column="Total_time")
+    assert result["lap_time"].to_list() == [30.0, 30.5, 30.0, 30.0, 30.5]
+
+
+def test_build_aggregates_on_frame_without_laps(frame):
+    tables = build_aggregates(frame.clear())
+    for name in ("section_bests", "theoretical_best_laps", "gaps_to_session_best", "rolling_pace"):
+        assert tables[name].is_empty()
+
+
+def test_theoretical_best_laps_without_sections(frame):
+    result = theoretical_best_laps(frame.drop("S1_time", "S2_time"))
+    assert result["theoretical_best"].to_list() == [None, None]
@@ -0,0 +1,52 @@
+import pandas as pd
+
+from indycar_data_parsing.cache import ParsedSectionTimesCache
+
+
+def _section_times():
+    return pd.DataFrame({"Car": [5], "S1_time": ["12.345"], "Lap": ["1"]})
+
+
+def test_cache_miss_returns_none(tmp_path):
+    pdf = tmp_path / "race.pdf"
+    pdf.write_bytes(b"%PDF-1.4 race")
+    cache = ParsedSectionTimesCache(tmp_path / "cache")
+    assert cache.get(pdf) is None
+
+
+def test_cache_round_trip(tmp_path):
+    pdf = tmp_path / "race.pdf"
+    pdf.write_bytes(b"%PDF-1.4 race")
+    cache = ParsedSectionTimesCache(tmp_path / "cache")
+    entry = cache.put(pdf, _section_times())
+    assert entry.parent == tmp_path / "cache"
+    assert cache.get(pdf).equals(_section_times())
+
+
+def test_cache_is_keyed_by_pdf_content(tmp_path):
+    pdf = tmp_path / "race.pdf"
+    pdf.write_bytes(b"%PDF-1.4 race")
+    cache = ParsedSectionTimesCache(tmp_path / "cache")
+    cache.put(pdf, _section_times())
+
+    pdf.write_bytes(b"%PDF-1.4 updated race")
+    assert cache.get(pdf) is None
+
+    copy = tmp_path / "copy.pdf"
+    copy.write_bytes(b"%PDF-1.4 race")
+    assert cache.get(copy).equals(_section_times())
+
+
+def test_cache_aggregates_round_trip(tmp_path):
+    import polars as pl
+
+    pdf = tmp_path / "race.pdf"
+    pdf.write_bytes(b"%PDF-1.4 race")
+    cache = ParsedSectionTimesCache(tmp_path / "cache")
+    assert cache.get_aggregates(pdf, ["section_bests"]) is None
+
+    table = pl.DataFrame({"Car": [5], "S1_time": [12.345]})
+    cache.put_aggregates(pdf, {"section_bests": table})
+    cached = cache.get_aggregates(pdf, ["section_bests"])
+    assert cached["section_bests"].equals(table)
+    assert cache.get_aggregates(pdf, ["section_bests", "rolling_pace"]) is None
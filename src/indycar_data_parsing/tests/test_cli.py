@@ -0,0 +1,214 @@
+from unittest.mock import patch, MagicMock
+
+import pandas as pd
+import pytest
+
+from indycar_data_parsing.cli import main, parse_pdfs
+
+PAGE = (
+    "Section Data for Car 5\n"
+    "Lap   T/S   S1   S2\n"
+    "1   T   12.345   23.456\n"
+    "S   100.1   200.2   300.3\n"
+    "Section Data for Car 6\n"
+    "Lap   T/S   S1   S2\n"
+    "1   T   11.111   22.222\n"
+    "S   111.1   222.2   333.3\n"
+)
+
+
+@pytest.fixture
+def mock_pdf_open():
+    with patch("pdfplumber.open") as mock_open:
+        mock_pdf = MagicMock()
+        page = MagicMock()
+        page.extract_text.return_value = PAGE
+        mock_pdf.pages = [page]
+        mock_open.return_value.__enter__.return_value = mock_pdf
+        yield mock_open
+
+
+@pytest.fixture
+def pdfs(tmp_path):
+    paths = []
+    for name in ("race1.pdf", "race2.pdf"):
+        path = tmp_path / name
+        path.write_bytes(f"%PDF-1.4 {name}".encode())
+        paths.append(str(path))
+    return paths
+
+
+def test_parse_pdfs_combines_sources(mock_pdf_open, pdfs):
+    df, tables = parse_pdfs(pdfs)
+    assert tables == {}
+    assert list(df["Car"]) == ["5", "6", "5", "6"]
+    assert list(df["Source"]) == [pdfs[0], pdfs[0], pdfs[1], pdfs[1]]
+
+
+def test_parse_pdfs_filters_cars(mock_pdf_open, pdfs):
+    df, _ = parse_pdfs(pdfs, cars=["6"])
+    assert list(df["Car"]) == ["6", "6"]
+    assert list(df["S1_time"]) == ["11.111", "11.111"]
+
+
+def test_parse_pdfs_uses_cache(mock_pdf_open, pdfs, tmp_path):
+    cache_dir = tmp_path / "cache"
+    first, _ = parse_pdfs(pdfs, cache_dir=str(cache_dir))
+    assert mock_pdf_open.call_count == 2
+
+    second, _ = parse_pdfs(pdfs, cache_dir=str(cache_dir))
+    assert mock_pdf_open.call_count == 2
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_main_writes_csv_and_profile(mock_pdf_open, pdfs, tmp_path, capsys):
+    output = tmp_path / "out.csv"
+    assert main([*pdfs, "-o", str(output), "--car", "5", "--profile"]) == 0
+
+    df = pd.read_csv(output, dtype=str)
+    assert list(df["Car"]) == ["5", "5"]
+    stderr = capsys.readouterr().err
+    for stage in ("read pdf", "parse", "combine", "write", "total wall time"):
+        assert stage in stderr
+
+
+def test_main_explicit_format(mock_pdf_open, pdfs, tmp_path):
+    output = tmp_path / "out.bin"
+    assert main([pdfs[0], "-o", str(output), "--format", "parquet"]) == 0
+    assert len(pd.read_parquet(output)) == 2
+
+
+def test_main_rejects_unknown_output_suffix(pdfs, tmp_path):
+    with pytest.raises(SystemExit):
+        main([pdfs[0], "-o", str(tmp_path / "out.xlsx")])
+
+
+def test_main_rejects_zero_jobs(pdfs, tmp_path):
+    with pytest.raises(SystemExit):
+        main([pdfs[0], "-o", str(tmp_path / "out.csv"), "--jobs", "0"])
+
+
+def test_parse_pdfs_aggregates_cached_with_parsed_data(mock_pdf_open, pdfs, tmp_path):
+    cache_dir = tmp_path / "cache"
+    _, first = parse_pdfs(pdfs, cars=["6"], cache_dir=str(cache_dir), aggregates=True)
+    assert first["section_bests"]["Car"].to_list() == ["6", "6"]
+    assert first["section_bests"]["Source"].to_list() == pdfs
+
+    with patch("indycar_data_parsing.analytics.build_aggregates") as build:
+        _, second = parse_pdfs(pdfs, cars=["6"], cache_dir=str(cache_dir), aggregates=True)
+    build.assert_not_called()
+    assert second["section_bests"].equals(first["section_bests"])
+
+
+def test_main_writes_aggregates_to_duckdb(mock_pdf_open, pdfs, tmp_path):
+    import duckdb
+
+    output = tmp_path / "out.duckdb"
+    assert main([*pdfs, "-o", str(output), "--aggregates"]) == 0
+    with duckdb.connect(str(output)) as con:
+        tables = {row[0] for row in con.execute("SHOW TABLES").fetchall()}
+        best = con.execute(
+            'SELECT "Car", theoretical_best FROM theoretical_best_laps ORDER BY "Source", "Car"'
+        ).fetchall()
+    assert {"section_times", "section_bests", "rolling_pace"} <= tables
+    assert best[0][0] == "5"
+    assert best[0][1] == pytest.approx(12.345 + 23.456)
+
+
+def test_main_writes_aggregates_as_sibling_files(mock_pdf_open, pdfs, tmp_path):
+    output = tmp_path / "out.parquet"
+    assert main([pdfs[0], "-o", str(output), "--aggregates"]) == 0
+    assert len(pd.read_parquet(tmp_path / "out.section_bests.parquet")) == 2
+
+
+def test_main_validate_writes_report(mock_pdf_open, pdfs, tmp_path, capsys):
+    output = tmp_path / "out.csv"
+    assert main([pdfs[0], "-o", str(output), "--validate", "--profile"]) == 0
+
+    stderr = capsys.readouterr().err
+    assert "validated 2 rows" in stderr
+    assert "section_sum: skipped (no lap time column given)" in stderr
+    assert "validate" in stderr
+    report = pd.read_csv(tmp_path / "out.validation.csv")
+    assert report.empty
+    assert list(report.columns) == ["row", "Source", "Car", "Lap", "check"]
+
+
+def test_main_validate_section_sum_with_lap_time_column(
+    mock_pdf_open, pdfs, tmp_path, capsys
+):
+    output = tmp_path / "out.csv"
+    args = [pdfs[0], "-o", str(output), "--validate", "--lap-time-column", "S2_time"]
+    assert main(args) == 0
+
+    assert "section_sum: 2 flagged" in capsys.readouterr().err
+    report = pd.read_csv(tmp_path / "out.validation.csv")
+    assert list(report["check"]) == ["section_sum", "section_sum"]
+
+
+def test_main_rejects_unknown_lap_time_column(mock_pdf_open, pdfs, tmp_path, capsys):
+    output = str(tmp_path / "out.csv")
+    with pytest.raises(SystemExit):
+        main([pdfs[0], "-o", output, "--aggregates", "--lap-time-column", "Nope"])
+    stderr = capsys.readouterr().err
+    assert "--lap-time-column 'Nope' is not a column of" in stderr
+    assert "S1_time" in stderr
+
+
+def test_aggregate_cache_is_keyed_by_lap_time_column(mock_pdf_open, pdfs, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    _, summed = parse_pdfs(pdfs[:1], cache_dir=cache_dir, aggregates=True)
+    _, by_column = parse_pdfs(
+        pdfs[:1], cache_dir=cache_dir, aggregates=True, lap_time_column="S1_time"
+    )
+    _, uncached = parse_pdfs(pdfs[:1], aggregates=True, lap_time_column="S1_time")
+
+    assert summed["theoretical_best_laps"]["best_lap"].to_list() == pytest.approx(
+        [12.345 + 23.456, 11.111 + 22.222]
+    )
+    assert by_column["theoretical_best_laps"].equals(uncached["theoretical_best_laps"])
+    assert by_column["theoretical_best_laps"]["best_lap"].to_list() == [12.345, 11.111]
+
+
+def test_main_parallel_jobs_match_serial(tmp_path):
+    from indycar_data_parsing.perf_harness import write_section_times_pdf
+
+    pdfs = [
+        str(write_section_times_pdf(tmp_path / f"race{i}.pdf", cars=2 + i, laps=5))
+        for i in range(3)
+    ]
+    serial = tmp_path / "serial.parquet"
+    parallel = tmp_path / "parallel.parquet"
+    assert main([*pdfs, "-o", str(serial)]) == 0
+    assert main([*pdfs, "-o", str(parallel), "--jobs", "3"]) == 0
+
+    expected = pd.read_parquet(serial)
+    assert len(expected) == (2 + 3 + 4) * 5
+    pd.testing.assert_frame_equal(pd.read_parquet(parallel), expected)
+
+
+def test_main_aggregates_skips_pdfs_without_laps(mock_pdf_open, pdfs, tmp_path):
+    cover_page, race_page = MagicMock(), MagicMock()
+    cover_page.extract_text.return_value = "Cover page\nNo section data"
+    race_page.extract_text.return_value = PAGE
+    cover_pdf, race_pdf = MagicMock(), MagicMock()
+    cover_pdf.pages = [cover_page]
+    race_pdf.pages = [race_page]
+    mock_pdf_open.return_value.__enter__.side_effect = [cover_pdf, race_pdf]
+
+    output = tmp_path / "out.csv"
+    assert main([*pdfs, "-o", str(output), "--aggregates", "--validate"]) == 0
+    best = pd.read_csv(tmp_path / "out.theoretical_best_laps.csv")
+    assert list(best["Source"]) == [pdfs[1], pdfs[1]]
+    written = pd.read_csv(output, dtype=str)
+    assert list(written["Car"]) == ["5", "6"]
+    assert list(written["Source"]) == [pdfs[1], pdfs[1]]
+
+
+def test_parse_pdfs_leaves_empty_frames_out_of_the_combine(pdfs):
+    laps = pd.DataFrame({"Car": ["5"], "Lap": [1]})
+    results = [(laps, {}, {}), (pd.DataFrame(), {}, {})]
+    with patch("indycar_data_parsing.cli.parse_pdf", side_effect=results):
+        df, _ = parse_pdfs(pdfs)
+    assert df["Lap"].dtype == "int64"
+    assert list(df["Source"]) == [pdfs[0]]
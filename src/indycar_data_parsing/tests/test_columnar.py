@@ -0,0 +1,73 @@
+import pandas as pd
+import polars as pl
+
+from indycar_data_parsing.columnar import (
+    key_columns,
+    lap_time_expr,
+    section_time_columns,
+    to_polars,
+)
+
+
+def _parsed():
+    return pd.DataFrame(
+        {
+            "Car": [5, 5],
+            "T/S_time": ["T", "T"],
+            "S1_time": ["12.345", "1:02.500"],
+            "S2_time": ["23.456", None],
+            "T/S_time_speed": ["100.1", "bad"],
+            "Lap": ["1", "2"],
+        }
+    )
+
+
+def test_to_polars_types_columns():
+    frame = to_polars(_parsed())
+    assert frame.schema["Car"] == pl.String
+    assert frame["Car"].to_list() == ["5", "5"]
+    assert frame.schema["Lap"] == pl.Int64
+    assert frame.schema["S1_time"] == pl.Float64
+    assert frame.schema["T/S_time_speed"] == pl.Float64
+    assert frame.schema["T/S_time"] == pl.String
+
+
+def test_to_polars_parses_minutes_and_invalid_values():
+    frame = to_polars(_parsed())
+    assert frame["S1_time"].to_list() == [12.345, 62.5]
+    assert frame["S2_time"].to_list() == [23.456, None]
+    assert frame["T/S_time_speed"].to_list() == [100.1, None]
+
+
+def test_to_polars_accepts_typed_polars_frame():
+    frame = to_polars(_parsed())
+    assert to_polars(frame).equals(frame)
+
+
+def test_section_time_columns_excludes_marker():
+    assert section_time_columns(to_polars(_parsed())) == ["S1_time", "S2_time"]
+
+
+def test_section_time_columns_excludes_lap_time_column():
+    frame = to_polars(_parsed().assign(Total_time=["35.801", "1:40.000"]))
+    assert section_time_columns(frame) == ["S1_time", "S2_time", "Total_time"]
+    assert section_time_columns(frame, exclude="Total_time") == ["S1_time", "S2_time"]
+
+
+def test_key_columns():
+    frame = to_polars(_parsed())
+    assert key_columns(frame) == ["Car"]
+    assert key_columns(frame.with_columns(Source=pl.lit("race.pdf"))) == ["Source", "Car"]
+
+
+def test_lap_time_expr_sums_sections():
+    frame = to_polars(_parsed())
+    lap_times = frame.select(lap_time_expr(frame).alias("lap_time"))["lap_time"]
+    assert lap_times.to_list()[0] == 12.345 + 23.456
+    assert lap_times.to_list()[1] is None
+
+
+def test_lap_time_expr_uses_lap_time_column():
+    frame = to_polars(_parsed())
+    lap_times = frame.select(lap_time_expr(frame, "S1_time").alias("lap_time"))["lap_time"]
+    assert lap_times.to_list() == [12.345, 62.5]
@@ -0,0 +1,53 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import indycar_data_parsing
+
+# Generous enough for slow CI machines, far below the ~700 ms that an eager
+# pandas import costs.
+IMPORT_BUDGET_SECONDS = 0.15
+HEAVY_MODULES = ("pandas", "pdfplumber", "polars", "pyarrow", "duckdb")
+SRC_DIR = Path(indycar_data_parsing.__file__).resolve().parents[1]
+
+_SNIPPET = """
+import sys, time
+t0 = time.perf_counter()
+import {module}
+print(time.perf_counter() - t0)
+print(",".join(m for m in {heavy!r} if m in sys.modules))
+"""
+
+
+def _import_in_fresh_interpreter(module: str = "indycar_data_parsing"):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(SRC_DIR)
+    result = subprocess.run(
+        [sys.executable, "-c", _SNIPPET.format(module=module, heavy=HEAVY_MODULES)],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    elapsed, heavy = result.stdout.splitlines()
+    return float(elapsed), [m for m in heavy.split(",") if m]
+
+
+def test_package_import_does_not_load_heavy_dependencies():
+    _, heavy = _import_in_fresh_interpreter()
+    assert heavy == [], f"Importing the package eagerly loaded: {heavy}"
+
+
+def test_parser_module_import_does_not_load_heavy_dependencies():
+    _, heavy = _import_in_fresh_interpreter("indycar_data_parsing.section_times_parser")
+    assert heavy == [], f"Importing the parser eagerly loaded: {heavy}"
+
+
+def test_package_import_within_startup_budget():
+    # Best of a few runs to keep the check stable on a noisy machine.
+    elapsed = min(_import_in_fresh_interpreter()[0] for _ in range(3))
+    assert elapsed < IMPORT_BUDGET_SECONDS, (
+        f"Importing the package took {elapsed * 1000:.1f} ms, "
+        f"budget is {IMPORT_BUDGET_SECONDS * 1000:.0f} ms"
+    )
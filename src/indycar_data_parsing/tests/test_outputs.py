@@ -0,0 +1,75 @@
+import duckdb
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from indycar_data_parsing.outputs import infer_output_format, write_output
+
+
+@pytest.fixture
+def section_times():
+    return pd.DataFrame(
+        {
+            "Car": [5, 5],
+            "T/S_time": ["T", "T"],
+            "S1_time": ["12.345", "13.111"],
+            "S1_time_speed": ["200.2", None],
+            "Lap": ["1", "2"],
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "filename, expected",
+    [
+        ("out.csv", "csv"),
+        ("out.parquet", "parquet"),
+        ("out.arrow", "arrow"),
+        ("out.feather", "arrow"),
+        ("out.duckdb", "duckdb"),
+    ],
+)
+def test_infer_output_format(filename, expected):
+    assert infer_output_format(filename) == expected
+
+
+def test_infer_output_format_unknown_suffix():
+    with pytest.raises(ValueError, match="Cannot infer output format"):
+        infer_output_format("out.xlsx")
+
+
+def test_write_output_unknown_format(tmp_path, section_times):
+    with pytest.raises(ValueError, match="Unknown output format"):
+        write_output(section_times, tmp_path / "out.csv", "xlsx")
+
+
+def test_write_csv(tmp_path, section_times):
+    path = tmp_path / "out.csv"
+    write_output(section_times, path)
+    df = pd.read_csv(path, dtype=str)
+    assert list(df.columns) == list(section_times.columns)
+    assert list(df["S1_time"]) == ["12.345", "13.111"]
+
+
+def test_write_parquet(tmp_path, section_times):
+    path = tmp_path / "out.parquet"
+    write_output(section_times, path)
+    assert pq.read_table(path).to_pandas().equals(section_times)
+
+
+def test_write_arrow(tmp_path, section_times):
+    path = tmp_path / "out.arrow"
+    write_output(section_times, path)
+    with pa.memory_map(str(path), "r") as source:
+        df = pa.ipc.open_file(source).read_all().to_pandas()
+    assert df.equals(section_times)
+
+
+def test_write_duckdb_replaces_table(tmp_path, section_times):
+    path = tmp_path / "out.duckdb"
+    write_output(section_times, path)
+    write_output(section_times.head(1), path)
+    with duckdb.connect(str(path)) as con:
+        rows = con.execute('SELECT "Car", "S1_time", "Lap" FROM section_times').fetchall()
+    assert rows == [(5, "12.345", "1")]
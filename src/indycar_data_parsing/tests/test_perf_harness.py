@@ -0,0 +1,158 @@
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from indycar_data_parsing import perf_harness
+from indycar_data_parsing.columnar import to_polars
+from indycar_data_parsing.section_times_parser import (
+    AllCarsSectionTimesParser,
+    SectionTimesParser,
+)
+from indycar_data_parsing.validation import validate
+
+BASELINE_PATH = Path(__file__).resolve().parents[3] / "benchmarks" / "parse_baseline.json"
+# Wall-clock comparisons against the stored baseline are machine dependent; opt in
+# with INDYCAR_PERF_CHECK_TIME=1 on the machine the baseline was recorded on.
+CHECK_TIME = os.environ.get("INDYCAR_PERF_CHECK_TIME") == "1"
+# The full scaling suites take tens of seconds; opt in with INDYCAR_PERF_SUITES=1.
+RUN_SUITES = os.environ.get("INDYCAR_PERF_SUITES") == "1"
+
+
+def _result(cars, laps, seconds, pages=None, reads=None, peak_bytes=1000, rows=None):
+    pages = pages if pages is not None else cars
+    return {
+        "cars": cars,
+        "laps": laps,
+        "sections": 2,
+        "pages": pages,
+        "rows": rows if rows is not None else cars * laps,
+        "page_reads": {"parse all cars": reads if reads is not None else pages},
+        "stages": {"parse all cars": {"seconds": seconds, "peak_bytes": peak_bytes}},
+    }
+
+
+def test_synthetic_pdf_round_trips_through_parser(tmp_path):
+    pdf = perf_harness.write_section_times_pdf(tmp_path / "race.pdf", cars=3, laps=25)
+    df = AllCarsSectionTimesParser(str(pdf)).parse_section_times()
+    assert len(df) == 3 * 25
+    assert df["Car"].unique().tolist() == ["1", "2", "3"]
+    assert df[df["Car"] == "2"]["Lap"].tolist() == [str(lap) for lap in range(1, 26)]
+    assert set(df.columns) >= {
+        "S1_time",
+        "S2_time",
+        "Total_time",
+        "S1_time_speed",
+        "S2_time_speed",
+    }
+    report = validate(to_polars(df), perf_harness.LAP_TIME_COLUMN)
+    assert report.is_valid
+    assert report.skipped == {}
+
+
+def test_section_times_pages_is_deterministic():
+    assert perf_harness.section_times_pages(2, 30) == perf_harness.section_times_pages(2, 30)
+    assert len(perf_harness.section_times_pages(2, 30)) == 4
+
+
+def test_scaling_exponent():
+    assert perf_harness.scaling_exponent([1, 2, 4], [3, 6, 12]) == pytest.approx(1.0)
+    assert perf_harness.scaling_exponent([1, 2, 4], [3, 12, 48]) == pytest.approx(2.0)
+    with pytest.raises(ValueError):
+        perf_harness.scaling_exponent([2, 2], [1, 2])
+
+
+def test_check_scaling_flags_quadratic_growth():
+    linear = [_result(cars, 10, 0.01 * cars) for cars in (1, 2, 4, 8)]
+    quadratic = [_result(cars, 10, 0.01 * cars**2) for cars in (1, 2, 4, 8)]
+    assert perf_harness.check_scaling(linear, "cars") == []
+    failures = perf_harness.check_scaling(quadratic, "cars")
+    assert len(failures) == 1
+    assert "parse all cars time grows as cars^2.00" in failures[0]
+
+
+def test_check_scaling_skips_stages_below_noise_floor():
+    tiny = [_result(cars, 10, 0.0001 * cars**2) for cars in (1, 2, 4)]
+    assert perf_harness.check_scaling(tiny, "cars") == []
+
+
+def test_check_page_reads_flags_rescans_per_car():
+    results = [_result(4, 10, 0.01, pages=4, reads=16)]
+    failures = perf_harness.check_page_reads(results)
+    assert failures == ["parse all cars at 4 cars x 10 laps read 16 pages for a 4 page PDF"]
+
+
+def test_check_validation_overhead():
+    def with_stages(parse, validate):
+        result = _result(8, 10, parse)
+        result["stages"].update(
+            {
+                "to polars": {"seconds": 0.001, "peak_bytes": 0},
+                "validate": {"seconds": validate, "peak_bytes": 0},
+            }
+        )
+        return result
+
+    assert perf_harness.check_validation_overhead([with_stages(0.5, 0.002)]) == []
+    # Below the parse time floor the ratio is dominated by fixed costs.
+    assert perf_harness.check_validation_overhead([with_stages(0.05, 0.05)]) == []
+    failures = perf_harness.check_validation_overhead([with_stages(0.5, 0.1)])
+    assert failures == ["validation at 8 cars x 10 laps took 20.2% of parse time (allowed 5%)"]
+
+
+def test_compare_to_baseline():
+    baseline = {
+        "tolerances": {"time": 2.0, "memory": 1.5},
+        "runs": [_result(2, 10, 0.1, peak_bytes=1_000_000)],
+    }
+    within = [_result(2, 10, 0.15, peak_bytes=1_100_000)]
+    assert perf_harness.compare_to_baseline(within, baseline) == []
+    assert perf_harness.compare_to_baseline([_result(3, 10, 9.0)], baseline) == []
+
+    slow = [_result(2, 10, 0.5, peak_bytes=1_000_000)]
+    failures = perf_harness.compare_to_baseline(slow, baseline)
+    assert len(failures) == 1 and "parse all cars took 500.0 ms" in failures[0]
+    assert perf_harness.compare_to_baseline(slow, baseline, check_time=False) == []
+
+    hungry = [_result(2, 10, 0.1, peak_bytes=2_000_000)]
+    failures = perf_harness.compare_to_baseline(hungry, baseline)
+    assert len(failures) == 1 and "peaked at" in failures[0]
+
+    short = [_result(2, 10, 0.1, peak_bytes=1_000_000, rows=19)]
+    assert perf_harness.compare_to_baseline(short, baseline) == [
+        "2 cars x 10 laps x 2 sections: parsed 19 rows, baseline 20"
+    ]
+
+
+def test_parse_reads_each_page_once(tmp_path):
+    results = perf_harness.run([(3, 30)], repeats=1, workdir=tmp_path)
+    assert results[0]["page_reads"] == {"parse all cars": 6, "parse one car": 6}
+    assert perf_harness.check_page_reads(results) == []
+
+
+def test_harness_flags_per_car_rescans(tmp_path, monkeypatch):
+    def rescan_per_car(self):
+        frames = []
+        for car in (1, 2, 3):
+            parser = SectionTimesParser(self.pdf_path, car, pdf_reader_cls=self._pdf_reader_cls)
+            frames.append(parser.parse_section_times().assign(Car=car))
+        return pd.concat(frames, ignore_index=True)
+
+    monkeypatch.setattr(AllCarsSectionTimesParser, "parse_section_times", rescan_per_car)
+    results = perf_harness.run([(3, 30)], repeats=1, workdir=tmp_path)
+    failures = perf_harness.check_page_reads(results)
+    assert len(failures) == 1 and "parse all cars" in failures[0]
+
+
+@pytest.mark.skipif(not RUN_SUITES, reason="set INDYCAR_PERF_SUITES=1 to run the scaling suites")
+@pytest.mark.parametrize("axis", sorted(perf_harness.DEFAULT_SUITES))
+def test_parse_scales_linearly_and_within_baseline(axis):
+    results = perf_harness.run(perf_harness.DEFAULT_SUITES[axis], repeats=1)
+    baseline = json.loads(BASELINE_PATH.read_text())
+
+    assert perf_harness.check_page_reads(results) == []
+    assert perf_harness.check_scaling(results, axis) == []
+    assert perf_harness.check_validation_overhead(results) == []
+    assert perf_harness.compare_to_baseline(results, baseline, check_time=CHECK_TIME) == []
@@ -0,0 +1,43 @@
+from unittest.mock import patch
+
+from indycar_data_parsing.timing import StageTimer
+
+
+def test_stage_accumulates_time():
+    timer = StageTimer()
+    with patch("time.perf_counter", side_effect=[1.0, 1.5, 2.0, 2.25]):
+        with timer.stage("parse"):
+            pass
+        with timer.stage("parse"):
+            pass
+    assert timer.timings == {"parse": 0.75}
+    assert timer.peak_memory == {}
+
+
+def test_merge_adds_timings():
+    timer = StageTimer()
+    timer.add("read pdf", 1.0)
+    timer.merge({"read pdf": 0.5, "parse": 0.25})
+    assert timer.timings == {"read pdf": 1.5, "parse": 0.25}
+
+
+def test_track_memory_records_peak_per_stage():
+    timer = StageTimer(track_memory=True)
+    with timer.stage("allocate"):
+        data = bytearray(4 * 1024 * 1024)
+        del data
+    with timer.stage("idle"):
+        pass
+    peaks = timer.peak_memory
+    assert peaks["allocate"] >= 4 * 1024 * 1024
+    assert peaks["idle"] < 1024 * 1024
+
+
+def test_report():
+    timer = StageTimer()
+    timer.add("read pdf", 0.5)
+    timer.add("parse", 0.0125)
+    assert timer.report().splitlines() == [
+        "read pdf       500.0 ms",
+        "parse           12.5 ms",
+    ]
@@ -0,0 +1,131 @@
+import polars as pl
+import pytest
+
+from indycar_data_parsing.columnar import to_polars
+from indycar_data_parsing.validation import validate
+
+
+@pytest.fixture
+def frame():
+    return pl.DataFrame(
+        {
+            "Car": [5, 5, 6],
+            "T/S_time": ["T", "T", "T"],
+            "S1_time": [10.0, 9.0, 9.5],
+            "S1_time_speed": [200.0, 201.0, 202.0],
+            "S2_time": [20.0, 21.0, 20.5],
+            "S2_time_speed": [100.0, 101.0, 102.0],
+            "Lap": [1, 2, 1],
+            "Total": [30.0, 30.0, 30.0],
+        }
+    )
+
+
+def _checks(report):
+    return list(zip(report.flagged["row"].to_list(), report.flagged["check"].to_list()))
+
+
+def test_validate_clean_frame(frame):
+    report = validate(frame, lap_time_column="Total")
+    assert report.is_valid
+    assert report.rows_checked == 3
+    assert report.counts() == {
+        "marker": 0,
+        "lap_order": 0,
+        "speed_pairing": 0,
+        "section_sum": 0,
+    }
+
+
+def test_validate_flags_shifted_marker(frame):
+    shifted = frame.with_columns(pl.Series("T/S_time", ["T", "T", "12.3"]))
+    report = validate(shifted)
+    assert _checks(report) == [(2, "marker")]
+
+
+def test_validate_flags_lap_order_per_car(frame):
+    shuffled = frame.with_columns(pl.Series("Lap", [2, 1, 1]))
+    report = validate(shuffled)
+    assert _checks(report) == [(1, "lap_order")]
+    assert report.flagged.row(0, named=True) == {
+        "row": 1,
+        "Car": 5,
+        "Lap": 1,
+        "check": "lap_order",
+    }
+
+
+def test_validate_flags_missing_lap(frame):
+    report = validate(frame.with_columns(pl.Series("Lap", [1, None, 1])))
+    assert _checks(report) == [(1, "lap_order")]
+
+
+def test_validate_flags_unpaired_speed(frame):
+    unpaired = frame.with_columns(
+        pl.Series("S2_time_speed", [100.0, None, 102.0]),
+        pl.Series("S1_time", [10.0, 9.0, None]),
+    )
+    report = validate(unpaired)
+    assert _checks(report) == [(1, "speed_pairing"), (2, "speed_pairing")]
+
+
+def test_validate_flags_missing_speed_columns(frame):
+    report = validate(frame.drop("S2_time_speed"))
+    assert report.counts()["speed_pairing"] == 3
+
+
+def test_validate_flags_section_sum_mismatch(frame):
+    report = validate(frame.with_columns(pl.Series("Total", [30.0, 30.5, None])), "Total")
+    assert _checks(report) == [(1, "section_sum")]
+
+
+def test_validate_section_sum_tolerance(frame):
+    nearly = frame.with_columns(pl.Series("Total", [30.005, 30.0, 30.0]))
+    assert validate(nearly, "Total").is_valid
+    assert not validate(nearly, "Total", tolerance=0.001).is_valid
+
+
+def test_validate_skips_section_sum_without_lap_time_column(frame):
+    report = validate(frame)
+    assert "section_sum" not in report.checks
+    assert report.skipped == {"section_sum": "no lap time column given"}
+
+
+def test_validate_parser_output_with_missing_speed_row():
+    import pandas as pd
+
+    parsed = pd.DataFrame(
+        {
+            "T/S_time": ["T", "T"],
+            "S1_time": ["12.345", "13.111"],
+            "S1_time_speed": ["200.2", None],
+            "Lap": ["1", "2"],
+        }
+    )
+    report = validate(to_polars(parsed))
+    assert _checks(report) == [(1, "speed_pairing")]
+
+
+def test_validate_empty_frame():
+    report = validate(pl.DataFrame())
+    assert report.is_valid
+    assert report.rows_checked == 0
+
+
+def test_summary(frame):
+    report = validate(frame.with_columns(pl.Series("Lap", [2, 1, 1])))
+    assert report.summary().splitlines() == [
+        "validated 3 rows",
+        "  marker: 0 flagged",
+        "  lap_order: 1 flagged",
+        "  speed_pairing: 0 flagged",
+        "  section_sum: skipped (no lap time column given)",
+    ]
+
+
+def test_validate_section_sum_with_parsed_total_column(frame):
+    with_total = frame.drop("Total").with_columns(
+        Total_time=pl.Series([30.0, 30.0, 31.0]),
+    )
+    report = validate(with_total, lap_time_column="Total_time")
+    assert _checks(report) == [(2, "section_sum")]
@@ -0,0 +1,69 @@
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class StageTimer:
+    """Accumulates wall-clock time (and optionally peak memory) spent in named stages of a run.
+
+    Memory tracking uses ``tracemalloc``, which slows Python allocations down
+    noticeably, so time and memory are best measured in separate runs. Stages
+    must not be nested while memory is tracked.
+    """
+
+    def __init__(self, track_memory: bool = False):
+        self._timings: dict[str, float] = {}
+        self._peak_memory: dict[str, int] = {}
+        self._track_memory = track_memory
+
+    @property
+    def timings(self) -> dict[str, float]:
+        """Returns the seconds spent in each stage, in the order stages were first entered."""
+        return dict(self._timings)
+
+    @property
+    def peak_memory(self) -> dict[str, int]:
+        """Returns the peak bytes allocated within each stage (empty unless tracking memory)."""
+        return dict(self._peak_memory)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Times the body of the ``with`` block and adds it to the named stage."""
+        started_tracing = False
+        if self._track_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+            if self._track_memory:
+                _, peak = tracemalloc.get_traced_memory()
+                self._peak_memory[name] = max(self._peak_memory.get(name, 0), peak - baseline)
+                if started_tracing:
+                    tracemalloc.stop()
+
+    def add(self, name: str, seconds: float) -> None:
+        """Adds ``seconds`` to the named stage."""
+        self._timings[name] = self._timings.get(name, 0.0) + seconds
+
+    def merge(self, timings: dict[str, float]) -> None:
+        """Adds the timings recorded elsewhere (e.g. in a worker process) to this timer."""
+        for name, seconds in timings.items():
+            self.add(name, seconds)
+
+    def report(self) -> str:
+        """Returns a human readable table of the recorded stage timings."""
+        width = max((len(name) for name in self._timings), default=0)
+        lines = []
+        for name, seconds in self._timings.items():
+            line = f"{name:<{width}}  {seconds * 1000:10.1f} ms"
+            if name in self._peak_memory:
+                line += f"  {self._peak_memory[name] / 1024:10.1f} KiB peak"
+            lines.append(line)
+        return "\n".join(lines)
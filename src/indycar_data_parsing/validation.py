@@ -0,0 +1,166 @@
+"""Vectorized consistency checks for parsed section times.
+
+Mis-parses tend to be silent: columns shift when a header changes mid-document,
+or a speed row does not pair with its time row. ``validate`` runs every check as
+a Polars expression over the typed frame from ``columnar.to_polars`` in one pass
+and returns only the flagged rows.
+"""
+
+from __future__ import annotations
+
+import polars as pl
+
+from indycar_data_parsing.columnar import (
+    LAP_COLUMN,
+    MARKER_COLUMN,
+    SPEED_SUFFIX,
+    key_columns,
+    section_time_columns,
+    sum_of_sections,
+)
+
+DEFAULT_TOLERANCE = 0.01
+ROW_COLUMN = "row"
+CHECK_COLUMN = "check"
+
+CHECK_MARKER = "marker"
+CHECK_LAP_ORDER = "lap_order"
+CHECK_SPEED_PAIRING = "speed_pairing"
+CHECK_SECTION_SUM = "section_sum"
+
+
+class ValidationReport:
+    """Rows flagged by ``validate``, one row per failed check."""
+
+    def __init__(
+        self,
+        flagged: pl.DataFrame,
+        rows_checked: int,
+        checks: list[str],
+        skipped: dict[str, str] | None = None,
+    ):
+        self._flagged = flagged
+        self._rows_checked = rows_checked
+        self._checks = checks
+        self._skipped = skipped or {}
+
+    @property
+    def flagged(self) -> pl.DataFrame:
+        """Returns the flagged rows: row index, car keys, lap number and failed check."""
+        return self._flagged
+
+    @property
+    def rows_checked(self) -> int:
+        """Returns the number of rows that were validated."""
+        return self._rows_checked
+
+    @property
+    def checks(self) -> list[str]:
+        """Returns the names of the checks that were run."""
+        return self._checks
+
+    @property
+    def skipped(self) -> dict[str, str]:
+        """Returns the checks that were not run, with the reason for each."""
+        return dict(self._skipped)
+
+    @property
+    def is_valid(self) -> bool:
+        """Returns True if no row was flagged."""
+        return self._flagged.is_empty()
+
+    def counts(self) -> dict[str, int]:
+        """Returns the number of flagged rows per check (zero for checks that passed)."""
+        counts = dict.fromkeys(self._checks, 0)
+        for check, count in self._flagged[CHECK_COLUMN].value_counts().iter_rows():
+            counts[check] = count
+        return counts
+
+    def summary(self) -> str:
+        """Returns a one-line-per-check summary of the report."""
+        lines = [f"validated {self._rows_checked} rows"]
+        lines.extend(f"  {check}: {count} flagged" for check, count in self.counts().items())
+        lines.extend(f"  {check}: skipped ({reason})" for check, reason in self._skipped.items())
+        return "\n".join(lines)
+
+
+def marker_check(frame: pl.DataFrame) -> pl.Expr:
+    """Flags rows whose T/S column is not the ``T`` marker, a sign of shifted columns."""
+    return (pl.col(MARKER_COLUMN) != "T").fill_null(True)
+
+
+def lap_order_check(frame: pl.DataFrame) -> pl.Expr:
+    """Flags laps that are missing or do not increase strictly within a car."""
+    keys = key_columns(frame)
+    step = pl.col(LAP_COLUMN).diff()
+    if keys:
+        step = step.over(keys)
+    return pl.col(LAP_COLUMN).is_null() | (step <= 0).fill_null(False)
+
+
+def speed_pairing_check(frame: pl.DataFrame, lap_time_column: str | None = None) -> pl.Expr:
+    """Flags rows where a section has a time without a speed, or a speed without a time."""
+    flags = []
+    for column in section_time_columns(frame, exclude=lap_time_column):
+        speed_column = f"{column}{SPEED_SUFFIX}"
+        if speed_column in frame.columns:
+            flags.append(pl.col(column).is_null() != pl.col(speed_column).is_null())
+        else:
+            flags.append(pl.col(column).is_not_null())
+    return pl.any_horizontal(flags) if flags else pl.lit(False)
+
+
+def section_sum_check(
+    frame: pl.DataFrame, lap_time_column: str, tolerance: float = DEFAULT_TOLERANCE
+) -> pl.Expr:
+    """Flags laps whose section times do not add up to the lap time within ``tolerance`` seconds."""
+    sections = section_time_columns(frame, exclude=lap_time_column)
+    difference = sum_of_sections(sections) - pl.col(lap_time_column)
+    return (difference.abs() > tolerance).fill_null(pl.col(lap_time_column).is_not_null())
+
+
+def validate(
+    frame: pl.DataFrame,
+    lap_time_column: str | None = None,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> ValidationReport:
+    """Runs every consistency check over the typed frame.
+
+    Args:
+        frame (pl.DataFrame): Typed section times from ``columnar.to_polars``.
+        lap_time_column (str | None): Column holding the lap total. The section sum
+            check only runs when it is given, and is listed in ``skipped`` otherwise.
+        tolerance (float): Allowed difference in seconds between the section sum and lap time.
+
+    Returns:
+        ValidationReport: The flagged rows and per-check counts.
+    """
+    checks = {}
+    skipped = {}
+    if MARKER_COLUMN in frame.columns:
+        checks[CHECK_MARKER] = marker_check(frame)
+    else:
+        skipped[CHECK_MARKER] = f"no {MARKER_COLUMN} column"
+    if LAP_COLUMN in frame.columns:
+        checks[CHECK_LAP_ORDER] = lap_order_check(frame)
+    else:
+        skipped[CHECK_LAP_ORDER] = f"no {LAP_COLUMN} column"
+    checks[CHECK_SPEED_PAIRING] = speed_pairing_check(frame, lap_time_column)
+    if lap_time_column is not None:
+        checks[CHECK_SECTION_SUM] = section_sum_check(frame, lap_time_column, tolerance)
+    else:
+        skipped[CHECK_SECTION_SUM] = "no lap time column given"
+
+    index = [ROW_COLUMN, *key_columns(frame)]
+    if LAP_COLUMN in frame.columns:
+        index.append(LAP_COLUMN)
+    flagged = (
+        frame.with_row_index(ROW_COLUMN)
+        .select(*index, *(expr.alias(name) for name, expr in checks.items()))
+        .filter(pl.any_horizontal(list(checks)))
+        .unpivot(on=list(checks), index=index, variable_name=CHECK_COLUMN, value_name="failed")
+        .filter(pl.col("failed"))
+        .drop("failed")
+        .sort(ROW_COLUMN, CHECK_COLUMN)
+    )
+    return ValidationReport(flagged, frame.height, list(checks), skipped)